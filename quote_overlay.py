@@ -15,6 +15,19 @@ Python: 3.7+
 Usage:
     python quote_overlay.py          # Run normally
     python quote_overlay.py --debug  # Run with debug output
+    python quote_overlay.py --daemon  # Stay resident; later launches show quotes through it
+    python quote_overlay.py --stop-daemon  # Stop the resident host
+    python quote_overlay.py --benchmark-gradient  # Compare gradient renderers
+    python quote_overlay.py --benchmark-categories  # Compare category matchers
+    python quote_overlay.py --benchmark-normalize  # Check and time text normalization
+    python quote_overlay.py --benchmark-renderers  # Compare widget tree and canvas renderers (needs a display)
+    python quote_overlay.py --render-cards [DIR]  # Render quote cards to PNG without a display
+    python quote_overlay.py --ingest FILE  # Load a .json/.jsonl/.csv quote file into the local quote store
+    python quote_overlay.py --benchmark-store  # Time opening the quote store and picking a quote at 15 to 1M quotes
+    python quote_overlay.py --benchmark-quote-memory  # Bytes per quote for a 100k pool: dicts vs Quote records
+    python quote_overlay.py --check-startup  # Fail if cold import exceeds the budget
+    python quote_overlay.py --check-countdown  # Simulate the auto-close countdown: wakeups, redraws, lateness
+    python quote_overlay.py --check-quote-client  # Retry, ETag, keep-alive and circuit breaker against a stub server
 
 Dependencies:
     - requests==2.32.3 (API calls)
@@ -36,27 +49,35 @@ Features:
 For setup and installation, see README.md and SETUP.md
 """
 
+import time
+
+# Start of the startup trace (see Tracer)
+STARTUP_BEGIN = time.perf_counter()
+
+import collections
+import contextlib
+import functools
+import importlib
+import importlib.util
 import json
+import math
 import os
+import queue
 import random
 import re
-import shutil
+import struct
 import sys
-import tempfile
-import time
+import threading
 import tkinter as tk
-import webbrowser
-from tkinter import font, ttk
-from urllib.parse import quote as url_quote
-
-import requests
-
-# PIL for advanced visual effects (V5.0.0+)
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+import zlib
+from tkinter import font
+
+# Heavy or rarely needed modules (requests, PIL, ttk, webbrowser, shutil,
+# tempfile) are imported on first use through lazy_import()
+
+# PIL for advanced visual effects (V5.0.0+) - checked without importing it
+PIL_AVAILABLE = importlib.util.find_spec('PIL') is not None
+if not PIL_AVAILABLE:
     print("Warning: Pillow not installed. Advanced visual effects disabled.")
 
 # Debug mode - controlled via command line argument (--debug)
@@ -69,10 +90,23 @@ __license__ = "MIT"
 
 # Animation and UI constants
 WINDOW_OPACITY = 0.96          # Slight transparency for elegant look
-FADE_IN_STEP = 0.12            # Opacity increment per frame (faster)
-FADE_OUT_STEP = 0.16           # Opacity decrement per frame (faster)
-FADE_IN_DELAY_MS = 15          # Milliseconds between fade-in frames
-FADE_OUT_DELAY_MS = 12         # Milliseconds between fade-out frames
+FADE_IN_MS = 120               # Fade-in duration (snappy)
+FADE_OUT_MS = 72               # Fade-out duration (snappier)
+ANIMATION_FRAME_MS = 15        # Frame interval of the animation clock
+QUOTE_POLL_MS = 50             # Milliseconds between checks for a fetched quote
+MEASURE_CACHE_SIZE = 4096      # Text widths remembered by FontRegistry
+PROGRESS_MIN_FRAME_MS = 100    # Never redraw the progress bar more often than this
+MIN_WINDOW_WIDTH = 320         # Responsive window width bounds (px)
+MAX_WINDOW_WIDTH = 800
+MIN_WINDOW_HEIGHT = 200        # Short quotes keep the classic card height
+
+# Quote font family and point size for each fontSize setting
+QUOTE_FONT_FAMILY = 'Segoe UI'
+FONT_SIZES = {
+    "small": 11,
+    "medium": 13,
+    "large": 15
+}
 
 # Fallback quotes - MOTIVATIONAL & INSPIRATIONAL ONLY
 # Focused on action, growth, persistence, and achieving goals
@@ -197,19 +231,339 @@ THEMES = {
     }
 }
 
+# Per-widget theme options. Values naming a THEMES color are looked up in
+# the theme; anything else ('white') is used as is.
+WIDGET_STYLES = {
+    'root': {'bg': 'window_bg'},
+    'main_frame': {'bg': 'window_bg', 'highlightbackground': 'border'},
+    'top_bar': {'bg': 'accent'},
+    'button_frame': {'bg': 'window_bg'},
+    'content_frame': {'bg': 'window_bg'},
+    'settings_btn': {'bg': 'accent', 'fg': 'white', 'activebackground': 'accent_hover', 'activeforeground': 'white'},
+    'theme_btn': {'bg': 'accent', 'fg': 'white', 'activebackground': 'accent_hover', 'activeforeground': 'white',
+                  'text': 'toggle_label'},
+    'close_btn': {'fg': 'hint', 'bg': 'window_bg',
+                  'activebackground': 'close_hover_bg', 'activeforeground': 'close_hover_fg'},
+    'quote_label': {'fg': 'text', 'bg': 'window_bg'},
+    'author_label': {'fg': 'author', 'bg': 'window_bg'},
+    'hint_label': {'fg': 'hint', 'bg': 'window_bg'},
+    'progress_frame': {'bg': 'progress_bg'},
+    'progress_bar': {'bg': 'accent'},
+}
+
+# Canvas renderer: options for the canvas itself and for each item tag
+CANVAS_STYLES = {
+    'canvas': {'bg': 'window_bg', 'highlightbackground': 'border', 'highlightcolor': 'border'},
+    'top_bar': {'fill': 'accent'},
+    'close_btn': {'fill': 'hint', 'activefill': 'close_hover_fg'},
+    'theme_btn_bg': {'fill': 'accent', 'activefill': 'accent_hover'},
+    'theme_btn_text': {'text': 'toggle_label'},
+    'settings_btn_bg': {'fill': 'accent', 'activefill': 'accent_hover'},
+    'quote': {'fill': 'text'},
+    'author': {'fill': 'author'},
+    'hint': {'fill': 'hint'},
+    'progress_track': {'fill': 'progress_bg'},
+    'progress_bar': {'fill': 'accent'},
+}
+
+# Theme button shows the theme it switches to
+THEME_TOGGLE_LABELS = {'light': 'Dark', 'dark': 'Light'}
+
+
+def compile_theme(theme, styles=WIDGET_STYLES):
+    """Resolve a style table against one theme into ready-to-use configure() options"""
+    values = {**THEMES[theme], 'toggle_label': THEME_TOGGLE_LABELS[theme]}
+    return {
+        name: {option: values.get(value, value) for option, value in options.items()}
+        for name, options in styles.items()
+    }
+
+
+# Compiled once at import; apply_theme() only walks these dicts
+THEME_STYLES = {theme: compile_theme(theme) for theme in THEMES}
+CANVAS_THEME_STYLES = {theme: compile_theme(theme, CANVAS_STYLES) for theme in THEMES}
+
+# Settings window: options for each kind of widget it contains
+SETTINGS_WINDOW_STYLES = {
+    'window': {'bg': 'window_bg'},
+    'frame': {'bg': 'window_bg'},
+    'label': {'bg': 'window_bg', 'fg': 'text'},
+    'scale': {'bg': 'window_bg', 'fg': 'accent', 'troughcolor': 'progress_bg'},
+    'button': {'bg': 'accent', 'fg': 'white', 'activebackground': 'accent_hover', 'activeforeground': 'white'},
+}
+SETTINGS_WINDOW_THEME_STYLES = {theme: compile_theme(theme, SETTINGS_WINDOW_STYLES) for theme in THEMES}
+
+# Settings window choices: (label, setting value)
+POSITION_OPTIONS = [
+    ("Bottom Right", "bottomRight"),
+    ("Bottom Left", "bottomLeft"),
+    ("Top Right", "topRight"),
+    ("Top Left", "topLeft")
+]
+CATEGORY_OPTIONS = [
+    ("Motivation & Inspiration", "motivation"),
+    ("Learning & Growth", "learning"),
+    ("Creativity & Innovation", "creativity"),
+    ("Productivity & Focus", "productivity"),
+    ("All Categories", "all")
+]
+
 # Configuration
 CONFIG = {
     "timer_duration": 15000,  # 15 seconds in milliseconds (default, will be overridden by settings)
-    "api_url": "https://dummyjson.com/quotes/random",
+    "api_bulk_url": "https://dummyjson.com/quotes",  # Paginated quotes endpoint
+    "api_bulk_limit": 100,  # Quotes per bulk request
     "api_timeout": 5,  # 5 seconds
+    "api_max_retries": 2,  # Retries after a connection error, 429 or 5xx
+    "api_backoff_base": 0.25,  # Seconds; jittered backoff doubles on each retry
+    "circuit_failure_threshold": 2,  # Failed requests in a row before the API is skipped
+    "circuit_open_seconds": 60,  # First window without network calls; doubles after each failed probe
+    "circuit_open_max_seconds": 1800,  # Longest window without network calls
+    "circuit_probe_timeout": 1.5,  # Seconds allowed for the single probe that re-enables the API
+    "quote_fetch_deadline": 3,  # Seconds to wait for the API before keeping the fallback quote
     "window_width": 340,  # Default width (will be dynamic in Phase 3)
     "window_padding": 18,  # Tighter padding
     "corner_offset": 24,  # Distance from screen edges
+    "gradient_cache_max_bytes": 8 * 1024 * 1024,  # ~16 rendered 800x200 gradients
+    "quote_pool_low_watermark": 25,  # Refill the local quote pool below this many quotes
+    "quote_pool_high_watermark": 150,  # Stop refilling once the pool holds this many
+    "startup_import_budget_ms": 80,  # --check-startup fails if a cold import takes longer
+    "daemon_connect_timeout": 0.25,  # Seconds a launcher waits for the resident host
+    "settings_debounce_ms": 400,  # Coalesce settings changes made within this window
 }
 
 # Settings file path
 SETTINGS_FILE = os.path.join(os.path.dirname(__file__), 'user_settings.json')
 
+# Settings schema - every key in user_settings.json with its default and allowed values.
+# SECURITY: saved values outside the schema are dropped and replaced by the default.
+SETTINGS_SCHEMA = {
+    "timerDuration": {"type": "int", "default": 15, "min": 5, "max": 60},  # Seconds
+    "position": {"type": "choice", "default": "bottomRight",
+                 "choices": ['bottomRight', 'bottomLeft', 'topRight', 'topLeft']},
+    "fontSize": {"type": "choice", "default": "medium", "choices": ['small', 'medium', 'large']},
+    "category": {"type": "choice", "default": "motivation", "choices": [*CATEGORY_KEYWORDS, 'all']},
+    "theme": {"type": "choice", "default": "light", "choices": list(THEMES)},
+    "renderer": {"type": "choice", "default": "widgets", "choices": ['widgets', 'canvas']},
+}
+
+# Rendered gradient bitmaps, stored next to the settings file
+GRADIENT_CACHE_DIR = os.path.join(os.path.dirname(SETTINGS_FILE), 'gradient_cache')
+
+# Local pool of prefetched quotes (JSON lines), stored next to the settings file
+QUOTE_POOL_FILE = os.path.join(os.path.dirname(SETTINGS_FILE), 'quote_pool.jsonl')
+
+# Bulk-ingested quote corpus (--ingest), a memory-mapped QuoteStore next to the settings file
+QUOTE_STORE_FILE = os.path.join(os.path.dirname(SETTINGS_FILE), 'quote_store.bin')
+INGEST_CHUNK_SIZE = 2000  # Quotes per process-pool task
+
+# Quote API health (circuit breaker state, recent failures and latencies), stored next to the settings file
+API_HEALTH_FILE = os.path.join(os.path.dirname(SETTINGS_FILE), 'api_health.json')
+
+# Port and token of the running resident host (--daemon), stored next to the settings file
+DAEMON_FILE = os.path.join(os.path.dirname(SETTINGS_FILE), 'quote_daemon.json')
+
+# Startup tracing - enabled by --debug or QUOTE_OVERLAY_TRACE=1 (or =path/to/trace.json)
+TRACE_ENV_VAR = 'QUOTE_OVERLAY_TRACE'
+TRACE_FILE = os.path.join(os.path.dirname(SETTINGS_FILE), 'startup_trace.json')
+
+
+class Tracer:
+    """Records named spans as Chrome trace events (chrome://tracing, Perfetto)
+
+    When disabled, span() returns a shared no-op context manager and add()
+    returns immediately, so instrumented code costs one method call.
+    """
+
+    NULL_SPAN = contextlib.nullcontext()
+
+    def __init__(self, enabled=False, path=TRACE_FILE):
+        self.enabled = enabled
+        self.path = path
+        self.events = []  # list.append is atomic, so worker threads can record too
+        self.local = threading.local()
+        self.pid = os.getpid()
+
+    def span(self, name, category='startup'):
+        """Context manager recording the time spent inside it"""
+        if not self.enabled:
+            return self.NULL_SPAN
+        return self.record_span(name, category)
+
+    @contextlib.contextmanager
+    def record_span(self, name, category):
+        depth = getattr(self.local, 'depth', 0)
+        self.local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.local.depth = depth
+            self.add(name, start, time.perf_counter(), category, depth)
+
+    def add(self, name, start, end, category='startup', depth=None):
+        """Record a span from two time.perf_counter() readings"""
+        if not self.enabled:
+            return
+        thread = threading.current_thread()
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - STARTUP_BEGIN) * 1e6, 1),
+            "dur": round((end - start) * 1e6, 1),
+            "pid": self.pid,
+            "tid": thread.ident,
+            "args": {
+                "thread": thread.name,
+                "depth": getattr(self.local, 'depth', 0) if depth is None else depth
+            }
+        })
+
+    def write(self):
+        """Write the timeline as Chrome trace JSON (best effort)"""
+        if not self.enabled:
+            return
+        try:
+            with open(self.path, 'w') as f:
+                json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms"}, f)
+            if DEBUG_MODE:
+                print(f"Startup trace written to {self.path}")
+        except OSError as e:
+            if DEBUG_MODE:
+                print(f"Error writing startup trace: {e}")
+
+    def print_startup_report(self, first_paint):
+        """Print where the time went between module import and the first painted frame"""
+        main_thread = threading.main_thread().ident
+        phases = sorted(
+            (e for e in self.events if e["tid"] == main_thread and e["cat"] == 'startup'),
+            key=lambda e: e["ts"]
+        )
+        imports = [e for e in self.events if e["cat"] == 'import']
+
+        print("Startup budget (ms):")
+        for event in phases:
+            indent = '  ' * event["args"]["depth"]
+            print(f"  {indent + event['name']:<28} {event['dur'] / 1000:8.1f}")
+        print(f"  {'total to first frame':<28} {(first_paint - STARTUP_BEGIN) * 1000:8.1f}")
+
+        if imports:
+            print("Lazy imports (cold, on first use):")
+            for event in sorted(imports, key=lambda e: -e["dur"]):
+                print(f"  {event['name']:<28} {event['dur'] / 1000:8.1f}")
+
+
+_trace_setting = os.environ.get(TRACE_ENV_VAR, '')
+TRACER = Tracer(
+    enabled=DEBUG_MODE or bool(_trace_setting),
+    path=_trace_setting if _trace_setting not in ('', '1') else TRACE_FILE
+)
+
+
+def traced(name, category='startup'):
+    """Decorator recording each call as a span; returns the function unchanged when tracing is off"""
+    def decorator(func):
+        if not TRACER.enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with TRACER.span(name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def lazy_import(name):
+    """Import a module on first use, tracing how long the cold import took"""
+    module = sys.modules.get(name)
+    if module is None:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        TRACER.add(f'import {name}', start, time.perf_counter(), category='import')
+    return module
+
+
+def atomic_write(path, data):
+    """Replace path with data through a temp file in the same directory and a rename
+
+    data is str (written as UTF-8), bytes, or an iterable of bytes chunks.
+    Readers never see a partial file; on failure the temp file is removed
+    and the exception re-raised.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if isinstance(data, (bytes, bytearray)):
+        data = (data,)
+
+    tmp_path = None
+    try:
+        with lazy_import('tempfile').NamedTemporaryFile(
+            mode='wb', delete=False, dir=os.path.dirname(path) or '.', suffix='.tmp'
+        ) as tmp:
+            tmp_path = tmp.name
+            for chunk in data:
+                tmp.write(chunk)
+        lazy_import('shutil').move(tmp_path, path)
+    except BaseException:
+        if tmp_path and os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass  # Best effort cleanup
+        raise
+
+
+def check_startup():
+    """Measure a cold import of this module with -X importtime against the budget
+
+    Returns True when the import fits in CONFIG["startup_import_budget_ms"].
+    """
+    subprocess = lazy_import('subprocess')
+    module_dir, module_file = os.path.split(os.path.abspath(__file__))
+    module_name = os.path.splitext(module_file)[0]
+    command = [
+        sys.executable, '-X', 'importtime', '-c',
+        f'import sys; sys.path.insert(0, {module_dir!r}); import {module_name}'
+    ]
+
+    # Best of three fresh interpreters (the first may still be compiling bytecode)
+    best_ms, best_children = None, {}
+    for _ in range(3):
+        result = subprocess.run(command, capture_output=True, text=True)
+        children = {}
+        for line in result.stderr.splitlines():
+            # Format: "import time: self [us] | cumulative | imported package",
+            # nested imports are indented and printed before their parent
+            parts = line.split('|')
+            if len(parts) != 3 or not parts[1].strip().isdigit():
+                continue
+            depth = (len(parts[2]) - len(parts[2].lstrip()) - 1) // 2
+            name = parts[2].strip()
+            cumulative_ms = int(parts[1]) / 1000
+            if depth == 0:
+                if name == module_name and (best_ms is None or cumulative_ms < best_ms):
+                    best_ms, best_children = cumulative_ms, children
+                children = {}
+            elif depth == 1:
+                children[name] = cumulative_ms
+
+    if best_ms is None:
+        print("Unable to measure import time.")
+        return False
+
+    budget_ms = CONFIG["startup_import_budget_ms"]
+    print(f"Cold import of {module_name}: {best_ms:.1f} ms (budget {budget_ms} ms)")
+    for name, ms in sorted(best_children.items(), key=lambda item: -item[1])[:8]:
+        print(f"  {name:<24} {ms:8.1f}")
+
+    if best_ms > budget_ms:
+        print("Startup budget exceeded.")
+        return False
+    return True
+
+
 # Pre-compiled regex patterns for performance
 # Sentence splitter - handles straight and curly quotes properly
 SENTENCE_SPLIT_PATTERN = re.compile(
@@ -217,220 +571,2572 @@ SENTENCE_SPLIT_PATTERN = re.compile(
     re.UNICODE
 )
 
+# Sentence boundaries for normalize_quote_text(): a word ending in one of these
+# characters, followed by a word matching SENTENCE_START_PATTERN (the lookahead
+# of SENTENCE_SPLIT_PATTERN), starts a new sentence
+SENTENCE_END_CHARS = '.!?…'
+SENTENCE_START_PATTERN = re.compile(r'["\'(\[]?\w')
+
+# Normalized text is memoized by raw text; the API returns the same quotes often
+NORMALIZE_CACHE_SIZE = 2048
+
+# Expected normalize_quote_text() output for known problem inputs
+NORMALIZE_GOLDEN_CASES = [
+    ("HELLO WORLD", "Hello world"),
+    ("WHO'S THERE", "Who's there"),
+    ("HeLLo WoRLd", "Hello world"),
+    ("It'S a new day.", "It's a new day."),
+    ("  DON'T   stop.  KEEP going!  ", "Don't stop. Keep going!"),
+    ("WAIT... what? \"GO\" now.", "Wait... What? \"Go\" now."),
+    ("(BELIEVE) in yourself. [ALWAYS]", "(Believe) in yourself. [Always]"),
+    ("Dream big - WORK hard… 'START' today", "Dream big - work hard… 'Start' today"),
+    ("ÉCOLE D'ÉTÉ. ça va", "École d'été. Ça va"),
+    ("I am A Leader. 3 GOALS matter", "I am a leader. 3 goals matter"),
+    ("", ""),
+]
+
+# Category matchers compiled once at import: one word-boundary alternation per
+# category, plus a keyword index so all categories can be found from one tokenization
+CATEGORY_PATTERNS = {
+    category: re.compile(r'\b(?:' + '|'.join(map(re.escape, keywords)) + r')\b', re.IGNORECASE)
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+KEYWORD_CATEGORIES = {}
+for _category, _keywords in CATEGORY_KEYWORDS.items():
+    for _keyword in _keywords:
+        KEYWORD_CATEGORIES.setdefault(_keyword.lower(), set()).add(_category)
+KEYWORD_SET = frozenset(KEYWORD_CATEGORIES)
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def match_categories(quote_text):
+    """Return every category whose keywords appear in the text, in a single scan"""
+    if not quote_text.isascii():
+        # Unicode case folding can match keywords that lower() does not produce
+        return [c for c, pattern in CATEGORY_PATTERNS.items() if pattern.search(quote_text)]
+
+    # A whole \w+ token equal to a keyword is exactly a \bkeyword\b match
+    found = set()
+    for keyword in KEYWORD_SET.intersection(WORD_PATTERN.findall(quote_text.lower())):
+        found |= KEYWORD_CATEGORIES[keyword]
+
+    return [category for category in CATEGORY_KEYWORDS if category in found]
+
+
+def normalize_word(word):
+    """Lowercase ALL CAPS words and interior capitals in one word"""
+    if word.isascii():
+        # For ASCII both rules together reduce to lowercasing every letter
+        return word.lower()
+
+    # Step 1: ALL CAPS word (like "HELLO" or "WHO'S") - lowercase everything
+    letters = ''.join(filter(str.isalpha, word))
+    if len(letters) > 1 and all(map(str.isupper, letters)):
+        word = word.lower()
+
+    # Step 2: lowercase the first letter and every interior capital
+    return ''.join(
+        char.lower() if char.isalpha() and (index == 0 or char.isupper()) else char
+        for index, char in enumerate(word)
+    )
+
+
+def capitalize_first_letter(word):
+    """Uppercase the first alphabetic character of a word"""
+    for index, char in enumerate(word):
+        if char.isalpha():
+            return word[:index] + char.upper() + word[index + 1:]
+    return word
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_quote_text(text):
+    """Normalize text to fix capitalization issues
+
+    Handles:
+    - ALL CAPS words: "HELLO WORLD" → "Hello world"
+    - ALL CAPS with apostrophes: "WHO'S THERE" → "Who's there"
+    - Interior capitals: "HeLLo" → "Hello"
+    - Capitals after apostrophes: "It'S" → "It's"
+    - Proper sentence capitalization (only first word capitalized)
+    - Preserves punctuation (!, ?, ..., etc.)
+    - Collapses runs of whitespace to single spaces
+
+    Works word by word in a single pass and matches normalize_text_reference()
+    exactly. Results are memoized by raw text.
+    """
+    fixed_words = []
+    previous = None
+
+    for word in text.split():
+        fixed = normalize_word(word)
+        # Capitalize the first word of each sentence
+        if previous is None or (previous[-1] in SENTENCE_END_CHARS and SENTENCE_START_PATTERN.match(word)):
+            fixed = capitalize_first_letter(fixed)
+        fixed_words.append(fixed)
+        previous = word
+
+    return ' '.join(fixed_words)
+
+
+def normalize_text_reference(text):
+    """Multi-pass normalizer (the original V5.0.1 implementation).
+    Kept as the reference for benchmark_normalize(); do not use on the launch path.
+    """
+    # Clean up whitespace
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    # Split into sentences using pre-compiled pattern
+    sentences = SENTENCE_SPLIT_PATTERN.split(text) if SENTENCE_SPLIT_PATTERN.search(text) else [text]
+
+    cleaned_sentences = []
+
+    for sentence in sentences:
+        words = sentence.split()
+        fixed_words = []
+
+        for word_idx, word in enumerate(words):
+            # Step 1: Check if word is ALL CAPS
+            # Extract only alphabetic characters to check
+            alpha_chars = [c for c in word if c.isalpha()]
+
+            if alpha_chars and len(alpha_chars) > 1 and all(c.isupper() for c in alpha_chars):
+                # ALL CAPS word (like "HELLO" or "WHO'S") - lowercase everything
+                word = word.lower()
+
+            # Step 2: Fix interior capitals
+            # Process character by character to handle apostrophes correctly
+            new_chars = []
+            for char_idx, char in enumerate(word):
+                if char_idx == 0:
+                    # Lowercase first char for now (will capitalize later if needed)
+                    new_chars.append(char.lower() if char.isalpha() else char)
+                elif char.isupper() and char.isalpha():
+                    # Check if previous char was apostrophe
+                    if char_idx > 0 and word[char_idx - 1] in ["'", "'"]:
+                        # Capital after apostrophe - lowercase it (fixes "It'S" → "It's")
+                        new_chars.append(char.lower())
+                    else:
+                        # Interior capital not after apostrophe - lowercase it
+                        new_chars.append(char.lower())
+                else:
+                    new_chars.append(char)
+
+            word = ''.join(new_chars)
+
+            # Step 3: Capitalize first letter ONLY if this is the first word in sentence
+            if word_idx == 0:
+                for i, char in enumerate(word):
+                    if char.isalpha():
+                        word = word[:i] + word[i].upper() + word[i+1:]
+                        break
+
+            fixed_words.append(word)
+
+        cleaned_sentences.append(' '.join(fixed_words))
+
+    return ' '.join(cleaned_sentences)
+
+
+def benchmark_normalize(corpus_size=10000):
+    """Check normalize_quote_text() against the golden cases and the reference, and time both"""
+    failures = [(raw, expected, normalize_quote_text(raw))
+                for raw, expected in NORMALIZE_GOLDEN_CASES
+                if normalize_quote_text(raw) != expected]
+    for raw, expected, actual in failures:
+        print(f"Golden case failed: {raw!r} -> {actual!r} (expected {expected!r})")
+
+    # Reproducible corpus mixing case styles, punctuation, apostrophes and accents
+    rng = random.Random(0)
+    vocabulary = [w for q in FALLBACK_QUOTES for w in q["text"].split()]
+    vocabulary += ["WHO'S", "It'S", "HeLLo", "ÉTÉ", "ça", "(WAIT)", '"GO"', "[NOTE]", "3", "…", "DON'T", "Ǆemal"]
+    styles = [str, str.upper, str.title, str.swapcase]
+    corpus = [
+        rng.choice(styles)(' '.join(rng.choice(vocabulary) for _ in range(rng.randint(4, 30))))
+        for _ in range(corpus_size)
+    ]
+
+    start = time.perf_counter()
+    expected = [normalize_text_reference(text) for text in corpus]
+    reference_s = time.perf_counter() - start
+
+    normalize_quote_text.cache_clear()
+    start = time.perf_counter()
+    actual = [normalize_quote_text(text) for text in corpus]
+    cold_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    # The most recent entries are still in the LRU cache
+    [normalize_quote_text(text) for text in corpus[-NORMALIZE_CACHE_SIZE:]]
+    warm_s = (time.perf_counter() - start) * corpus_size / min(corpus_size, NORMALIZE_CACHE_SIZE)
+
+    mismatches = sum(a != e for a, e in zip(actual, expected))
+    print(f"Golden cases: {len(NORMALIZE_GOLDEN_CASES) - len(failures)}/{len(NORMALIZE_GOLDEN_CASES)} passed")
+    print(f"Corpus: {corpus_size} quotes, {mismatches} mismatches against the reference")
+    print(f"  reference (multi-pass): {reference_s * 1000:8.1f} ms")
+    print(f"  single pass (cold):     {cold_s * 1000:8.1f} ms (x{reference_s / cold_s:.1f})")
+    print(f"  single pass (cached):   {warm_s * 1000:8.1f} ms (x{reference_s / warm_s:.1f})")
+    return not failures and not mismatches
+
+
+def dedupe_key(text):
+    """Normalize text for duplicate detection (case, punctuation and spacing)"""
+    return ' '.join(WORD_PATTERN.findall(text.casefold()))
+
+
+# Bit of each category in a Quote's category mask
+CATEGORY_BITS = {category: 1 << i for i, category in enumerate(CATEGORY_KEYWORDS)}
+
+
+def category_mask(quote_text):
+    """Category bitmask of the text (see match_categories)"""
+    mask = 0
+    for category in match_categories(quote_text):
+        mask |= CATEGORY_BITS[category]
+    return mask
+
+
+class Quote:
+    """Compact immutable quote record
+
+    Authors are interned, so thousands of quotes by one author share a
+    single string; categories are a precomputed integer bitmask instead of
+    a list, and the normalized dedupe key is computed once on first use.
+    """
+
+    __slots__ = ('text', 'author', 'mask', '_key')
+
+    def __init__(self, text, author, mask=None):
+        self.text = text
+        self.author = sys.intern(author)
+        self.mask = category_mask(text) if mask is None else mask
+        self._key = None
+
+    def __reduce__(self):
+        return (Quote, (self.text, self.author, self.mask))
+
+    def __eq__(self, other):
+        return isinstance(other, Quote) and (self.text, self.author) == (other.text, other.author)
+
+    def __hash__(self):
+        return hash((self.text, self.author))
+
+    def __repr__(self):
+        return f'Quote({self.text!r}, {self.author!r})'
+
+    @property
+    def key(self):
+        """Normalized form used for duplicate detection (cached)"""
+        if self._key is None:
+            self._key = dedupe_key(self.text)
+        return self._key
+
+    @property
+    def categories(self):
+        return [category for category, bit in CATEGORY_BITS.items() if self.mask & bit]
+
+    def matches(self, category):
+        return category == 'all' or bool(self.mask & CATEGORY_BITS.get(category, 0))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Quote from a {"text", "author", "categories"} JSON object"""
+        mask = 0
+        for category in data.get('categories', ()):
+            mask |= CATEGORY_BITS.get(category, 0)
+        return cls(data['text'], data['author'], mask)
+
+    def to_dict(self):
+        return {'text': self.text, 'author': self.author, 'categories': self.categories}
+
+
+def benchmark_quote_memory(count=100000):
+    """Compare bytes per quote of a 100k-quote pool held as {"text", "author"} dicts and as Quote records"""
+    tracemalloc = lazy_import('tracemalloc')
+    texts = [f'{quote["text"]} ({i})' for i in range(count // len(FALLBACK_QUOTES) + 1)
+             for quote in FALLBACK_QUOTES][:count]
+    masks = [category_mask(text) for text in texts]
+
+    def measure(build):
+        # Authors are rebuilt per quote, as each one is when parsed from JSON
+        tracemalloc.start()
+        start = tracemalloc.get_traced_memory()[0]
+        pool = build()
+        used = tracemalloc.get_traced_memory()[0] - start
+        tracemalloc.stop()
+        del pool
+        return used / count
+
+    # The dict form quotes had before Quote: {"text", "author"}, categories matched on demand
+    dict_bytes = measure(lambda: [
+        {'text': text, 'author': ''.join(('Author ', str(i % 500)))}
+        for i, text in enumerate(texts)
+    ])
+    quote_bytes = measure(lambda: [
+        Quote(text, ''.join(('Author ', str(i % 500))), mask)
+        for i, (text, mask) in enumerate(zip(texts, masks))
+    ])
+
+    print(f"{count} quotes, 500 authors (quote text itself not counted)")
+    print(f"  dict  {{text, author}}:          {dict_bytes:7.1f} bytes/quote")
+    print(f"  Quote (__slots__, interned):   {quote_bytes:7.1f} bytes/quote "
+          f"(x{dict_bytes / quote_bytes:.1f} smaller)")
+    return quote_bytes < dict_bytes
+
+
+def benchmark_categories(corpus_size=10000):
+    """Compare per-keyword re.search matching with the precompiled matchers"""
+    # Build a reproducible corpus from the fallback quotes and category keywords
+    rng = random.Random(0)
+    vocabulary = [w for q in FALLBACK_QUOTES for w in q["text"].split()]
+    vocabulary += [k.upper() if rng.random() < 0.2 else k for ks in CATEGORY_KEYWORDS.values() for k in ks]
+    corpus = [' '.join(rng.choice(vocabulary) for _ in range(rng.randint(6, 30))) for _ in range(corpus_size)]
+
+    def matches_category_reference(quote_text, category):
+        for keyword in CATEGORY_KEYWORDS[category]:
+            if re.search(r'\b' + re.escape(keyword) + r'\b', quote_text, re.IGNORECASE):
+                return True
+        return False
+
+    start = time.perf_counter()
+    expected = [[c for c in CATEGORY_KEYWORDS if matches_category_reference(text, c)] for text in corpus]
+    reference_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    per_category = [[c for c in CATEGORY_KEYWORDS if CATEGORY_PATTERNS[c].search(text)] for text in corpus]
+    compiled_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single_pass = [match_categories(text) for text in corpus]
+    single_pass_s = time.perf_counter() - start
+
+    identical = expected == per_category == single_pass
+    print(f"Corpus: {corpus_size} quotes, {len(CATEGORY_KEYWORDS)} categories")
+    print(f"  per-keyword re.search:   {reference_s * 1000:8.1f} ms")
+    print(f"  compiled per category:   {compiled_s * 1000:8.1f} ms (x{reference_s / compiled_s:.1f})")
+    print(f"  single-pass all matches: {single_pass_s * 1000:8.1f} ms (x{reference_s / single_pass_s:.1f})")
+    print("Results identical." if identical else "MISMATCH: matchers disagree!")
+    return identical
+
+
+def hex_to_rgb(hex_color):
+    """Convert a hex color string like '#faf8f5' to an (r, g, b) tuple"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+def is_valid_gradient_size(width, height):
+    """Check gradient dimensions against the resource limits"""
+    # SECURITY: Validate image dimensions to prevent excessive memory usage
+    MAX_WIDTH = 1920   # Full HD width
+    MAX_HEIGHT = 1080  # Full HD height
+
+    return 0 < width <= MAX_WIDTH and 0 < height <= MAX_HEIGHT
+
+
+def gradient_channel_steps(start, end, max_distance, max_squared):
+    """Find where one color channel changes value along the diagonal gradient
+
+    The per-pixel formula only depends on x**2 + y**2 and is monotonic in it, so
+    each channel is a set of concentric bands. Binary search finds the exact
+    squared distance at which every band begins, using the same float
+    arithmetic as the per-pixel loop so the result is pixel-identical.
+
+    Returns:
+        (initial_value, [(squared_distance, value), ...])
+    """
+    delta = end - start
+
+    def level(squared):
+        return int(start + delta * min((squared ** 0.5) / max_distance, 1.0))
+
+    initial = current = level(0)
+    final = level(max_squared)
+    steps = []
+    low = 0
+
+    while current != final:
+        lo, hi = low + 1, max_squared
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if level(mid) != current:
+                hi = mid
+            else:
+                lo = mid + 1
+        current = level(lo)
+        steps.append((lo, current))
+        low = lo
+
+    return initial, steps
+
+
+def gradient_band_rows(width, height, initial, steps):
+    """Build one channel of the gradient as mode 'L' bytes, one row of spans at a time
+
+    Each band starts where x**2 + y**2 reaches its squared distance t, so
+    on row y it starts at the smallest x with x*x >= t - y*y. A row is a few
+    runs of equal bytes, which costs O(height * steps) Python work however
+    far apart the two colors are.
+    """
+    bisect_right = lazy_import('bisect').bisect_right
+    isqrt = math.isqrt
+    run = [bytes((value,)) for value in range(256)]
+    starts = [squared for squared, _ in steps]
+    values = [initial] + [value for _, value in steps]
+    rows = []
+    for y in range(height):
+        y_squared = y * y
+        # Bands that start at or before x = 0 on this row are skipped outright
+        first = bisect_right(starts, y_squared)
+        row = []
+        x = 0
+        value = values[first]
+        for squared, next_value in steps[first:]:
+            edge = isqrt(squared - y_squared - 1) + 1
+            if edge >= width:
+                break
+            row.append(run[value] * (edge - x))
+            x, value = edge, next_value
+        row.append(run[value] * (width - x))
+        rows.append(b''.join(row))
+    return b''.join(rows)
+
+
+def create_diagonal_gradient(width, height, color1, color2):
+    """
+    Create a diagonal gradient image (top-left to bottom-right) using PIL.
+    Builds each channel from per-row spans of its color bands instead of a
+    per-pixel Python loop; output is identical to create_diagonal_gradient_reference().
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        color1: Starting color (hex string like '#faf8f5')
+        color2: Ending color (hex string like '#f3ede6')
+
+    Returns:
+        PIL Image object with diagonal gradient, or None if PIL unavailable or invalid size
+    """
+    if not PIL_AVAILABLE:
+        # Fallback: solid color image
+        return None
+
+    if not is_valid_gradient_size(width, height):
+        print(f"Warning: Invalid gradient size {width}x{height}, using fallback")
+        return None
+
+    Image = lazy_import('PIL.Image')
+    rgb1 = hex_to_rgb(color1)
+    rgb2 = hex_to_rgb(color2)
+
+    # Maximum distance is diagonal length
+    max_distance = (width**2 + height**2) ** 0.5
+    max_squared = (width - 1)**2 + (height - 1)**2
+
+    # Gray gradients share the same bands across channels - render them once
+    bands = {}
+    channels = []
+    for start, end in zip(rgb1, rgb2):
+        initial, steps = gradient_channel_steps(start, end, max_distance, max_squared)
+        key = (initial, tuple(steps))
+        if key not in bands:
+            bands[key] = Image.frombytes('L', (width, height), gradient_band_rows(width, height, initial, steps))
+        channels.append(bands[key])
+
+    return Image.merge('RGB', channels)
+
+
+def create_diagonal_gradient_reference(width, height, color1, color2):
+    """
+    Per-pixel diagonal gradient (the original V5.0.0 implementation).
+    Kept as the reference for benchmark_gradient(); do not use on the launch path.
+    """
+    if not PIL_AVAILABLE or not is_valid_gradient_size(width, height):
+        return None
+
+    Image = lazy_import('PIL.Image')
+    rgb1 = hex_to_rgb(color1)
+    rgb2 = hex_to_rgb(color2)
+
+    # Create image with putdata for better performance
+    image = Image.new('RGB', (width, height))
+
+    # Maximum distance is diagonal length
+    max_distance = (width**2 + height**2) ** 0.5
+
+    # Pre-calculate all pixel colors
+    pixels = []
+    for y in range(height):
+        for x in range(width):
+            # Calculate distance from top-left corner (0,0)
+            distance = (x**2 + y**2) ** 0.5
+            # Normalize to 0-1 range
+            ratio = min(distance / max_distance, 1.0)
+
+            # Interpolate between colors
+            r = int(rgb1[0] + (rgb2[0] - rgb1[0]) * ratio)
+            g = int(rgb1[1] + (rgb2[1] - rgb1[1]) * ratio)
+            b = int(rgb1[2] + (rgb2[2] - rgb1[2]) * ratio)
+
+            pixels.append((r, g, b))
+
+    # Apply all pixels at once (much faster than point-by-point)
+    image.putdata(pixels)
+
+    return image
+
+
+# Saturated color pairs for --benchmark-gradient: many bands per channel,
+# the worst case for the band renderer (the themes are near-gray)
+GRADIENT_BENCHMARK_PAIRS = [
+    ('red-green', '#ff0000', '#00ff80'),
+    ('black-white', '#000000', '#ffffff'),
+]
+
+
+def benchmark_gradient(min_width=320, max_width=800, height=200):
+    """Time both gradient renderers at every supported window width for each theme and saturated pair"""
+    if not PIL_AVAILABLE:
+        print("Pillow is required for the gradient benchmark.")
+        return False
+
+    pairs = [(name, colors['bg'], colors['bg_gradient']) for name, colors in THEMES.items()]
+    pairs += GRADIENT_BENCHMARK_PAIRS
+
+    identical = True
+    print(f"{'colors':<11} {'width':>5} {'reference ms':>13} {'bands ms':>9}  match")
+
+    for name, color1, color2 in pairs:
+        totals = [0.0, 0.0]
+        for width in range(min_width, max_width + 1):
+            args = (width, height, color1, color2)
+
+            start = time.perf_counter()
+            expected = create_diagonal_gradient_reference(*args)
+            reference_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            actual = create_diagonal_gradient(*args)
+            bands_ms = (time.perf_counter() - start) * 1000
+
+            match = actual.tobytes() == expected.tobytes()
+            identical = identical and match
+            totals[0] += reference_ms
+            totals[1] += bands_ms
+            print(f"{name:<11} {width:>5} {reference_ms:>13.2f} {bands_ms:>9.2f}  {'yes' if match else 'NO'}")
+
+        count = max_width - min_width + 1
+        print(f"{name:<11} {'mean':>5} {totals[0] / count:>13.2f} {totals[1] / count:>9.2f}  "
+              f"speedup x{totals[0] / max(totals[1], 1e-9):.1f}")
+
+    print("All gradients pixel-identical." if identical else "MISMATCH: renderers differ!")
+    return identical
+
+
+class GradientCache:
+    """Persistent cache of rendered gradients stored as raw RGB files
+
+    Each file is a small header (magic, size, CRC32 of the pixels) followed by
+    the raw RGB bytes. Entries are keyed by both colors and the dimensions,
+    file mtimes track recency, and the least recently used files are evicted
+    once the directory grows past max_bytes. The most recent images are also
+    kept in memory, which is what a resident host hits on every show.
+    """
+
+    MAGIC = b'QGRD1'
+    HEADER = struct.Struct('<5sHHI')
+    MEMORY_ENTRIES = 8
+
+    def __init__(self, directory=GRADIENT_CACHE_DIR, max_bytes=None):
+        self.directory = directory
+        self.max_bytes = max_bytes if max_bytes is not None else CONFIG["gradient_cache_max_bytes"]
+        self.memory = collections.OrderedDict()  # path -> image, most recent last
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, width, height, color1, color2):
+        """Build the cache file path from the normalized colors and size"""
+        # Re-format the parsed colors so the filename can never contain path characters
+        key = '{:02x}{:02x}{:02x}-{:02x}{:02x}{:02x}'.format(*hex_to_rgb(color1), *hex_to_rgb(color2))
+        return os.path.join(self.directory, f'{key}-{int(width)}x{int(height)}.rgb')
+
+    def get(self, width, height, color1, color2):
+        """Return the gradient image, loading it from disk or rendering and storing it"""
+        path = self.entry_path(width, height, color1, color2)
+
+        image = self.memory.get(path)
+        if image is not None:
+            self.memory.move_to_end(path)
+            self.hits += 1
+            if DEBUG_MODE:
+                print(f"Gradient cache hit (memory): {os.path.basename(path)}")
+            return image
+
+        image = self.load(path, width, height)
+        if image is not None:
+            self.hits += 1
+            if DEBUG_MODE:
+                print(f"Gradient cache hit: {os.path.basename(path)}")
+        else:
+            self.misses += 1
+            if DEBUG_MODE:
+                print(f"Gradient cache miss: {os.path.basename(path)}")
+
+            image = create_diagonal_gradient(width, height, color1, color2)
+            if image is None:
+                return None
+            self.store(path, image)
+
+        self.memory[path] = image
+        if len(self.memory) > self.MEMORY_ENTRIES:
+            self.memory.popitem(last=False)
+        return image
+
+    def load(self, path, width, height):
+        """Read and verify a cache entry, discarding it if it is corrupt"""
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        header_size = self.HEADER.size
+        if len(data) == width * height * 3 + header_size:
+            magic, stored_width, stored_height, checksum = self.HEADER.unpack_from(data)
+            pixels = data[header_size:]
+            if (magic == self.MAGIC and (stored_width, stored_height) == (width, height)
+                    and zlib.crc32(pixels) == checksum):
+                # Refresh mtime so LRU eviction keeps recently used entries
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                return lazy_import('PIL.Image').frombytes('RGB', (width, height), pixels)
+
+        if DEBUG_MODE:
+            print(f"Gradient cache entry failed integrity check: {os.path.basename(path)}")
+        self.remove(path)
+        return None
+
+    def store(self, path, image):
+        """Write a cache entry atomically, then enforce the size limit"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            pixels = image.tobytes()
+            header = self.HEADER.pack(self.MAGIC, image.width, image.height, zlib.crc32(pixels))
+            atomic_write(path, (header, pixels))
+            self.evict()
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"Error writing gradient cache: {e}")
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith('.rgb'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self.remove(path)
+            total -= size
+            if DEBUG_MODE:
+                print(f"Gradient cache evicted: {os.path.basename(path)}")
+
+    @staticmethod
+    def remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Best effort cleanup
+
+
+class CategoryIndex:
+    """Inverted index from category to quote IDs with per-category rotation
+
+    Quotes are categorized once when added. Each category draws from its own
+    shuffle bag: a random ID is swap-removed in O(1), so every quote is shown
+    once per rotation, the bag refills when it runs out, and the quote served
+    last is skipped so the same one never shows twice in a row.
+    Quotes added later (e.g. from the local quote pool) join the current
+    rotation immediately.
+    """
+
+    def __init__(self, quotes=()):
+        self.lock = threading.Lock()
+        self.quotes = []   # quote ID -> Quote
+        self.keys = set()  # dedupe keys of indexed quotes
+        self.ids = {'all': []}  # category -> quote IDs
+        self.bags = {}     # category -> IDs left in the current rotation
+        self.last = {}     # category -> ID served last
+        for quote in quotes:
+            self.add(quote)
+
+    def __len__(self):
+        return len(self.quotes)
+
+    def add(self, quote):
+        """Index a Quote, returning its ID (or None if it is a duplicate)"""
+        with self.lock:
+            if quote.key in self.keys:
+                return None
+            self.keys.add(quote.key)
+
+            quote_id = len(self.quotes)
+            self.quotes.append(quote)
+            for category in ('all', *quote.categories):
+                self.ids.setdefault(category, []).append(quote_id)
+                bag = self.bags.get(category)
+                if bag is not None:
+                    bag.append(quote_id)
+            return quote_id
+
+    def choose(self, category='all'):
+        """Draw the next quote in the category's rotation, or None if it has none"""
+        with self.lock:
+            ids = self.ids.get(category)
+            if not ids:
+                return None
+
+            bag = self.bags.get(category)
+            if not bag:
+                bag = self.bags[category] = list(ids)
+
+            # Avoid an immediate repeat (bounded retries keep the draw O(1))
+            last = self.last.get(category)
+            for _ in range(8):
+                index = random.randrange(len(bag))
+                if bag[index] != last:
+                    break
+
+            quote_id = bag[index]
+            bag[index] = bag[-1]
+            bag.pop()
+            self.last[category] = quote_id
+            return self.quotes[quote_id]
+
+
+# Category index over the curated quotes; the local quote pool adds to it as it loads and refills
+QUOTE_INDEX = CategoryIndex(Quote(quote["text"], quote["author"]) for quote in FALLBACK_QUOTES)
+
+
+class QuotePool:
+    """Persistent local pool of prefetched quotes stored as JSON lines
+
+    Each line holds a normalized quote, its author and the categories it
+    matches. Quotes are bucketed by category so a launch can take one in O(1)
+    (random swap-remove); a quote taken from one bucket is removed lazily from
+    the others. Quotes are deduplicated by their normalized text and the
+    pool never grows past quote_pool_high_watermark. The pool is shared with
+    the fetch and refill threads, so every operation holds the lock. New
+    quotes are also added to the optional CategoryIndex.
+    """
+
+    def __init__(self, path=QUOTE_POOL_FILE, index=None):
+        self.path = path
+        self.index = index
+        self.lock = threading.Lock()
+        self.live = {}  # dedupe key -> Quote, for every quote still in the pool
+        self.buckets = {'all': []}
+        self.dirty = False
+        self.load()
+
+    def __len__(self):
+        return len(self.live)
+
+    def load(self):
+        """Read the pool file, skipping malformed lines"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            return
+
+        quotes = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            # SECURITY: Validate pool entries the same way as API responses
+            if (isinstance(entry, dict) and isinstance(entry.get('text'), str)
+                    and isinstance(entry.get('author'), str) and isinstance(entry.get('categories'), list)
+                    and 0 < len(entry['text']) <= 1000 and len(entry['author']) <= 100):
+                quotes.append(Quote.from_dict(entry))
+
+        self.add(quotes)
+        self.dirty = False
+
+    def add(self, quotes):
+        """Add Quotes up to the high watermark, returning how many were new"""
+        added = []
+        capacity = CONFIG["quote_pool_high_watermark"]
+        with self.lock:
+            for quote in quotes:
+                if len(self.live) >= capacity:
+                    break
+                key = quote.key
+                if not key or key in self.live:
+                    continue
+                self.live[key] = quote
+                self.buckets['all'].append(quote)
+                for category in quote.categories:
+                    self.buckets.setdefault(category, []).append(quote)
+                added.append(quote)
+            if added:
+                self.dirty = True
+
+        if self.index is not None:
+            for quote in added:
+                self.index.add(quote)
+        return len(added)
+
+    def take(self, category='all'):
+        """Remove and return a random Quote matching the category, or None"""
+        with self.lock:
+            bucket = self.buckets.get(category, [])
+            while bucket:
+                index = random.randrange(len(bucket))
+                quote = bucket[index]
+                bucket[index] = bucket[-1]
+                bucket.pop()
+
+                if self.live.get(quote.key) is not quote:
+                    continue  # Already taken through another category
+
+                del self.live[quote.key]
+                self.dirty = True
+                return quote
+
+        return None
+
+    def save(self):
+        """Write the pool atomically (temp file + rename)"""
+        with self.lock:
+            lines = [json.dumps(quote.to_dict(), ensure_ascii=False) + '\n' for quote in self.live.values()]
+            self.dirty = False
+
+        try:
+            atomic_write(self.path, ''.join(lines))
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"Error saving quote pool: {e}")
+
+
+class CircuitBreaker:
+    """Persisted circuit breaker in front of the quote API
+
+    After circuit_failure_threshold failed requests in a row the circuit
+    opens and requests are refused without touching the network, so an
+    offline launch goes straight to the fallback quote instead of waiting
+    out the API timeout. Once the open window passes, one request is let
+    through as a half-open probe (short timeout, no retries): success closes
+    the circuit, failure reopens it for twice as long. State is saved to
+    API_HEALTH_FILE, so the window carries across launches; it uses wall
+    clock time for the same reason. Successes while the circuit is healthy
+    only update the latency samples in memory, written at most once per
+    LATENCY_SAVE_SECONDS, so normal requests cost no file writes.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+    LATENCY_SAMPLES = 8
+    LATENCY_SAVE_SECONDS = 600
+
+    def __init__(self, path=API_HEALTH_FILE, clock=time.time):
+        self.path = path
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0  # Failed requests in a row
+        self.opened_at = 0.0
+        self.open_seconds = CONFIG["circuit_open_seconds"]
+        self.probe_started = 0.0
+        self.latencies = []  # Milliseconds, most recent last
+        self.last_error = None
+        self.saved_at = 0.0
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.saved_at = os.fstat(f.fileno()).st_mtime
+                data = json.load(f)
+            if data.get('state') not in (self.CLOSED, self.OPEN, self.HALF_OPEN):
+                return
+            self.state = data['state']
+            self.failures = int(data.get('failures', 0))
+            self.opened_at = float(data.get('opened_at', 0))
+            self.open_seconds = min(max(float(data.get('open_seconds', self.open_seconds)),
+                                        CONFIG["circuit_open_seconds"]), CONFIG["circuit_open_max_seconds"])
+            self.probe_started = float(data.get('probe_started', 0))
+            self.latencies = [float(ms) for ms in data.get('latencies', [])][-self.LATENCY_SAMPLES:]
+            self.last_error = data.get('last_error')
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            if DEBUG_MODE:
+                print(f"Ignoring unreadable API health file: {e}")
+
+    def save(self):
+        """Write the state atomically; called with the lock held"""
+        data = {
+            'state': self.state,
+            'failures': self.failures,
+            'opened_at': self.opened_at,
+            'open_seconds': self.open_seconds,
+            'probe_started': self.probe_started,
+            'latencies': self.latencies,
+            'last_error': self.last_error,
+        }
+        self.saved_at = self.clock()
+        try:
+            atomic_write(self.path, json.dumps(data))
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"Error saving API health: {e}")
+
+    def transition(self, state, reason):
+        if DEBUG_MODE:
+            print(f"API circuit {self.state} -> {state}: {reason}")
+        self.state = state
+
+    def before_request(self):
+        """Return CLOSED to make a normal request, HALF_OPEN to probe, or None to skip the network"""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return self.CLOSED
+
+            now = self.clock()
+            if self.state == self.HALF_OPEN:
+                # Another launch is probing; take over only if it never reported back
+                if 0 <= now - self.probe_started < CONFIG["circuit_probe_timeout"] * 2:
+                    return None
+            elif 0 <= now - self.opened_at < self.open_seconds:
+                if DEBUG_MODE:
+                    print(f"API circuit open: skipping network for "
+                          f"{self.opened_at + self.open_seconds - now:.0f} s more ({self.last_error})")
+                return None
+
+            self.transition(self.HALF_OPEN, 'probing the API')
+            self.probe_started = now
+            self.save()
+            return self.HALF_OPEN
+
+    def record_success(self, latency_ms):
+        with self.lock:
+            self.latencies = (self.latencies + [round(latency_ms, 1)])[-self.LATENCY_SAMPLES:]
+            recovered = self.state != self.CLOSED or self.failures or self.last_error is not None
+            if self.state != self.CLOSED:
+                self.transition(self.CLOSED, f'API answered in {latency_ms:.0f} ms')
+            self.failures = 0
+            self.open_seconds = CONFIG["circuit_open_seconds"]
+            self.last_error = None
+            if recovered or not 0 <= self.clock() - self.saved_at < self.LATENCY_SAVE_SECONDS:
+                self.save()
+
+    def release_probe(self):
+        """Give up a probe that was never sent, so the next request probes instead"""
+        with self.lock:
+            if self.state == self.HALF_OPEN:
+                self.transition(self.OPEN, 'probe not sent')
+                self.save()
+
+    def record_failure(self, error):
+        with self.lock:
+            self.failures += 1
+            self.last_error = str(error)[:200]
+            if self.state == self.HALF_OPEN:
+                self.open_seconds = min(self.open_seconds * 2, CONFIG["circuit_open_max_seconds"])
+                self.opened_at = self.clock()
+                self.transition(self.OPEN, f'probe failed ({error}); retry in {self.open_seconds:.0f} s')
+            elif self.state == self.CLOSED and self.failures >= CONFIG["circuit_failure_threshold"]:
+                self.opened_at = self.clock()
+                self.transition(self.OPEN, f'{self.failures} failures in a row ({error}); '
+                                           f'retry in {self.open_seconds:.0f} s')
+            self.save()
+
+
+class QuoteClient:
+    """Client for the paginated quote API sharing one pooled keep-alive session
+
+    Connection errors, 429 and 5xx responses are retried a bounded number of
+    times with full-jitter exponential backoff. Pages are revalidated with
+    If-None-Match, so an unchanged page costs a 304 instead of a download.
+    Requests go through a persisted CircuitBreaker, so once the API is known
+    to be unreachable launches skip the network entirely. Safe to use from
+    worker threads.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    MAX_CACHED_PAGES = 32
+
+    def __init__(self, page_url=None, breaker=None):
+        self.page_url = page_url or CONFIG["api_bulk_url"]
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self.lock = threading.Lock()
+        self.session = None
+        self.etags = {}  # request key -> (ETag, parsed body)
+        self.total = None  # Corpus size reported by the API
+        self.fetched_pages = set()  # (limit, page number) already requested by this client
+
+    def get_session(self):
+        """Create the shared session on first use"""
+        with self.lock:
+            if self.session is None:
+                requests = lazy_import('requests')
+                HTTPAdapter = lazy_import('requests.adapters').HTTPAdapter
+                session = requests.Session()
+                # Retries are handled in get_json() so they can honor the deadline
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update({'Accept': 'application/json', 'Connection': 'keep-alive'})
+                self.session = session
+            return self.session
+
+    def get_json(self, url, params=None, deadline=None):
+        """GET a JSON document, retrying transient failures; returns None on failure
+
+        Returns None at once, without importing requests, while the circuit
+        breaker is open. A half-open probe is a single short request.
+        """
+        mode = self.breaker.before_request()
+        if mode is None:
+            return None
+
+        session = self.get_session()
+        requests = lazy_import('requests')
+        urlencode = lazy_import('urllib.parse').urlencode
+        request_key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        probing = mode == CircuitBreaker.HALF_OPEN
+        max_retries = 0 if probing else CONFIG["api_max_retries"]
+        error = None
+
+        for attempt in range(max_retries + 1):
+            timeout = CONFIG["circuit_probe_timeout"] if probing else CONFIG["api_timeout"]
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    break
+
+            with self.lock:
+                cached = self.etags.get(request_key)
+            headers = {'If-None-Match': cached[0]} if cached else {}
+
+            try:
+                start = time.perf_counter()
+                response = session.get(url, params=params, headers=headers, timeout=timeout)
+                if response.status_code not in self.RETRY_STATUSES:
+                    # Any definite answer means the API is reachable
+                    self.breaker.record_success((time.perf_counter() - start) * 1000)
+                if response.status_code == 304 and cached:
+                    return cached[1]
+                if response.status_code == 200:
+                    data = response.json()
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        with self.lock:
+                            self.etags.pop(request_key, None)
+                            self.etags[request_key] = (etag, data)
+                            if len(self.etags) > self.MAX_CACHED_PAGES:
+                                del self.etags[next(iter(self.etags))]
+                    return data
+                if response.status_code not in self.RETRY_STATUSES:
+                    return None
+                error = f"HTTP {response.status_code}"
+            except ValueError:
+                return None  # Invalid JSON is not worth retrying
+            except requests.RequestException as e:
+                error = e
+
+            if DEBUG_MODE:
+                print(f"API request attempt {attempt + 1} failed: {error}")
+            if attempt < max_retries:
+                delay = random.uniform(0, CONFIG["api_backoff_base"] * 2 ** attempt)
+                if deadline is not None:
+                    delay = min(delay, max(deadline - time.monotonic(), 0))
+                time.sleep(delay)
+
+        if error is not None:
+            self.breaker.record_failure(error)
+        elif probing:
+            self.breaker.release_probe()  # The deadline passed before the probe was sent
+        return None
+
+    def fetch_page(self, limit=None, deadline=None):
+        """Fetch one page of raw quote objects at a random page offset, or None
+
+        Pages this client has not requested yet are preferred, so successive
+        fetches (e.g. the launch fetch, then the refill) bring new quotes.
+        """
+        limit = limit or CONFIG["api_bulk_limit"]
+        # Page-aligned offsets keep request URLs stable for revalidation
+        pages = -(-self.total // limit) if self.total else 1
+        with self.lock:
+            unseen = [page for page in range(pages) if (limit, page) not in self.fetched_pages]
+            page = random.choice(unseen) if unseen else random.randrange(pages)
+            self.fetched_pages.add((limit, page))
+        params = {"limit": limit, "skip": page * limit}
+
+        data = self.get_json(self.page_url, params=params, deadline=deadline)
+        if not isinstance(data, dict) or not isinstance(data.get("quotes"), list):
+            return None
+        if isinstance(data.get("total"), int):
+            self.total = data["total"]
+        return data["quotes"]
+
+
+def check_quote_client():
+    """Exercise QuoteClient against a local stub server: retry, ETag revalidation, keep-alive
+
+    Also checks that repeated failures open the circuit breaker so the next
+    request never reaches the server. Uses a throwaway API health file.
+    """
+    http_server = lazy_import('http.server')
+    tempfile = lazy_import('tempfile')
+    stub = {'fail': 0, 'requests': 0, 'revalidated': 0, 'connections': set()}
+    etag = '"page-v1"'
+    body = json.dumps({"quotes": [{"quote": "Stub quote", "author": "Stub"}], "total": 1}).encode('utf-8')
+
+    class Handler(http_server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # Keep connections open between requests
+
+        def do_GET(self):
+            stub['requests'] += 1
+            stub['connections'].add(self.client_address)
+            if stub['fail']:
+                stub['fail'] -= 1
+                self.reply(503)
+            elif self.headers.get('If-None-Match') == etag:
+                stub['revalidated'] += 1
+                self.reply(304)
+            else:
+                self.reply(200, body)
+
+        def reply(self, status, content=b''):
+            self.send_response(status)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = http_server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, name='stub-api', daemon=True).start()
+    saved_config = dict(CONFIG)
+    CONFIG.update(api_backoff_base=0.01, api_timeout=2)
+    directory = tempfile.mkdtemp()
+    results = []
+
+    def check(name, passed, detail):
+        results.append(passed)
+        print(f"{'ok  ' if passed else 'FAIL'} {name}: {detail}")
+
+    try:
+        url = f'http://127.0.0.1:{server.server_address[1]}/quotes'
+        client = QuoteClient(url, breaker=CircuitBreaker(os.path.join(directory, 'api_health.json')))
+        client.get_session().trust_env = False  # Never route the stub through a proxy
+        params = {"limit": 1, "skip": 0}
+
+        stub['fail'] = 1
+        first = client.get_json(url, params)
+        check('retry', first is not None and stub['requests'] == 2,
+              f"503 then 200 -> {stub['requests']} requests, data {'returned' if first else 'missing'}")
+
+        second = client.get_json(url, params)
+        check('etag', stub['revalidated'] == 1 and second == first,
+              f"second request revalidated ({stub['revalidated']} x 304), cached page returned")
+
+        check('keep-alive', len(stub['connections']) == 1,
+              f"{stub['requests']} requests over {len(stub['connections'])} connection(s)")
+
+        stub['fail'] = 1000
+        before = stub['requests']
+        failed = client.get_json(url, params)
+        attempts = stub['requests'] - before
+        check('give up', failed is None and attempts == CONFIG["api_max_retries"] + 1,
+              f"persistent 503 -> None after {attempts} attempts")
+
+        for _ in range(CONFIG["circuit_failure_threshold"] - 1):
+            client.get_json(url, params)
+        before = stub['requests']
+        skipped = client.get_json(url, params)
+        check('circuit', skipped is None and stub['requests'] == before and client.breaker.state == 'open',
+              f"breaker {client.breaker.state}, {stub['requests'] - before} requests sent while open")
+    finally:
+        CONFIG.clear()
+        CONFIG.update(saved_config)
+        server.shutdown()
+        server.server_close()
+        lazy_import('shutil').rmtree(directory, ignore_errors=True)
+
+    ok = all(results)
+    print("QuoteClient OK." if ok else "QuoteClient check FAILED.")
+    return ok
+
+
+def parse_api_quote(data):
+    """Validate one API quote object, returning (text, author) or None"""
+    if not isinstance(data, dict):
+        return None
+
+    quote_text = data.get("quote", "")
+    author = data.get("author", "Unknown")
+
+    # SECURITY: Validate API response data types and lengths
+    if not isinstance(quote_text, str) or not isinstance(author, str):
+        return None  # Skip invalid data types
+
+    if len(quote_text) > 1000 or len(author) > 100:
+        return None  # Skip overly long quotes to prevent UI overflow
+
+    return quote_text, author
+
+
+def parse_quote_page(items):
+    """Validate, normalize and categorize a page of raw API quote objects into Quotes"""
+    batch = []
+    for item in items:
+        parsed = parse_api_quote(item)
+        if parsed is None or not parsed[0].strip():
+            continue
+        quote_text, author = parsed
+        batch.append(Quote(normalize_quote_text(quote_text), author, category_mask(quote_text)))
+    return batch
+
+
+def read_json_array(f, buffer_size=1 << 16):
+    """Yield the items of a top-level JSON array one by one, reading the file in blocks"""
+    decoder = json.JSONDecoder()
+    buffer = f.read(buffer_size).lstrip()
+    if buffer.startswith('{'):
+        # An object wrapper such as the API's {"quotes": [...]} cannot be streamed
+        data = json.loads(buffer + f.read())
+        yield from data.get("quotes", []) if isinstance(data, dict) else []
+        return
+    if not buffer.startswith('['):
+        raise ValueError("expected a JSON array of quotes")
+
+    position = 1
+    eof = False
+    while True:
+        # Skip separators between items
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except ValueError:
+            if eof:
+                raise
+            more = f.read(buffer_size)
+            eof = not more
+            buffer = buffer[position:] + more
+            position = 0
+            continue
+        yield item
+        position = end
+        if position > buffer_size:
+            buffer, position = buffer[position:], 0
+
+
+def read_json_lines(f):
+    """Yield the object on each non-blank line; malformed lines yield None"""
+    for line in f:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None  # Rejected by parse_api_quote() and counted as invalid
+
+
+def read_quote_records(path):
+    """Stream raw quote objects from a .json, .jsonl/.ndjson or .csv file
+
+    Records use the API's field names ("quote", "author"); a "text" field
+    is accepted in place of "quote". Nothing is validated here. A UTF-8 byte
+    order mark (as written by Excel and Notepad) is skipped.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        if extension == '.csv':
+            records = lazy_import('csv').DictReader(f)
+        elif extension in ('.jsonl', '.ndjson'):
+            records = read_json_lines(f)
+        else:
+            records = read_json_array(f)
+
+        for record in records:
+            if isinstance(record, dict) and "quote" not in record and "text" in record:
+                record = {"quote": record["text"], "author": record.get("author") or "Unknown"}
+            yield record
+
+
+def chunked(iterable, size):
+    """Yield lists of up to size items"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def ingest_quotes(path, store_path=QUOTE_STORE_FILE, workers=None, chunk_size=INGEST_CHUNK_SIZE):
+    """Normalize and categorize a quote file on a process pool into the local QuoteStore
+
+    Chunks of records are validated, normalized and categorized by
+    parse_quote_page() in worker processes. At most two chunks per worker
+    are in flight, so parsed quotes held in memory are bounded by the chunk
+    size; what grows with the input is an 8-byte dedupe digest and a 16-byte
+    store record per quote. The new store replaces the old one when done,
+    unless no quote was accepted. Reports throughput in quotes per second.
+    """
+    futures = lazy_import('concurrent.futures')
+    hashlib = lazy_import('hashlib')
+    workers = workers or os.cpu_count() or 1
+
+    read = duplicates = 0
+    seen = set()
+    start = time.perf_counter()
+    chunks = chunked(read_quote_records(path), chunk_size)
+    with QuoteStoreBuilder(store_path) as builder, \
+            futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        while True:
+            # Keep the pool busy without reading ahead of it
+            while len(pending) < workers * 2:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                read += len(chunk)
+                pending.append(executor.submit(parse_quote_page, chunk))
+            if not pending:
+                break
+
+            for quote in pending.popleft().result():
+                digest = hashlib.blake2b(quote.key.encode('utf-8'), digest_size=8).digest()
+                if digest in seen:
+                    duplicates += 1
+                    continue
+                seen.add(digest)
+                builder.add(quote)
+    accepted = builder.count
+
+    elapsed = time.perf_counter() - start
+    destination = store_path if accepted else f"nothing accepted, {store_path} left unchanged"
+    print(f"Ingested {accepted} quotes from {read} records "
+          f"({read - accepted - duplicates} invalid, {duplicates} duplicates) "
+          f"in {elapsed:.2f} s on {workers} processes: {read / max(elapsed, 1e-9):,.0f} quotes/s -> {destination}")
+    return accepted
+
+
+# Quote store file layout (all integers little-endian):
+#   header      magic, format version, flags, record count, category-names length
+#   categories  UTF-8 category names joined by newlines; bit i of a record's mask = name i
+#   counts      u32 number of records in each category, in name order
+#   records     fixed-width: blob offset, text length, author length, category bitmask
+#   members     u32 record numbers of each category, in name order
+#   blob        UTF-8 text immediately followed by UTF-8 author, for each record
+STORE_MAGIC = b'QSTR'
+STORE_VERSION = 2
+STORE_HEADER = struct.Struct('<4sHHII')
+STORE_RECORD = struct.Struct('<QIHH')
+STORE_MEMBER = struct.Struct('<I')
+
+
+class QuoteStoreBuilder:
+    """Write a QuoteStore file from a stream of Quotes
+
+    Text goes straight to a temporary blob file; only the 16-byte records
+    and 4-byte category memberships are kept in memory. finish() (or leaving
+    the with block) assembles the store next to its final path and
+    atomically replaces it, unless no quotes were added.
+    """
+
+    def __init__(self, path=QUOTE_STORE_FILE):
+        self.path = path
+        self.records = bytearray()
+        self.members = {category: lazy_import('array').array('I') for category in CATEGORY_BITS}
+        self.blob = lazy_import('tempfile').TemporaryFile(dir=os.path.dirname(path) or '.')
+        self.blob_size = 0
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.finish()
+        else:
+            self.blob.close()
+
+    def add(self, quote):
+        text = quote.text.encode('utf-8')
+        author = quote.author.encode('utf-8')[:0xFFFF]
+        self.records += STORE_RECORD.pack(self.blob_size, len(text), len(author), quote.mask)
+        for category, bit in CATEGORY_BITS.items():
+            if quote.mask & bit:
+                self.members[category].append(self.count)
+        self.blob.write(text)
+        self.blob.write(author)
+        self.blob_size += len(text) + len(author)
+        self.count += 1
+
+    def finish(self):
+        """Replace the store with the added quotes; returns False (keeping the old store) if there are none"""
+        if not self.count:
+            self.blob.close()
+            return False
+
+        try:
+            atomic_write(self.path, self.chunks())
+        finally:
+            self.blob.close()
+        return True
+
+    def chunks(self):
+        """The store file in order, as bytes chunks"""
+        names = '\n'.join(CATEGORY_BITS).encode('utf-8')
+        yield STORE_HEADER.pack(STORE_MAGIC, STORE_VERSION, 0, self.count, len(names))
+        yield names
+        for members in self.members.values():
+            yield STORE_MEMBER.pack(len(members))
+        yield self.records
+        for members in self.members.values():
+            if sys.byteorder != 'little':
+                members.byteswap()
+            yield members.tobytes()
+        self.blob.seek(0)
+        yield from iter(lambda: self.blob.read(1 << 20), b'')
+
+
+class RangeRotation:
+    """No-repeat rotation over range(size) in O(1) memory
+
+    Each rotation walks a random affine permutation i -> (a*i + b) % size
+    with a coprime to size, so every number is drawn once per rotation
+    without building a shuffled list of a million record numbers. As in
+    CategoryIndex, a new rotation never starts with the number served last.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.position = size  # Start a rotation on the first draw
+        self.last = None
+
+    def shuffle(self):
+        self.step = random.randrange(1, self.size) if self.size > 1 else 1
+        while math.gcd(self.step, self.size) != 1:
+            self.step = random.randrange(1, self.size)
+        self.offset = random.randrange(self.size)
+        if self.offset == self.last and self.size > 1:
+            self.offset = (self.offset + 1) % self.size
+        self.position = 0
+
+    def next(self):
+        if self.position >= self.size:
+            self.shuffle()
+        value = (self.step * self.position + self.offset) % self.size
+        self.position += 1
+        self.last = value
+        return value
+
+
+class QuoteStore:
+    """Read-only, memory-mapped QuoteStore (see QuoteStoreBuilder)
+
+    Opening reads only the header; choose() draws a record number from the
+    category's rotation (over the whole store, or over the category's member
+    list) and decodes just that record, so the cost of a launch does not
+    depend on how many quotes the store holds. Every record is
+    bounds-checked against the file before it is decoded. close() unmaps
+    the file and open() maps it again, keeping the rotations.
+    """
+
+    def __init__(self, path=QUOTE_STORE_FILE):
+        self.path = path
+        self.data = None
+        self.rotations = {}  # category -> RangeRotation
+        self.open()
+
+    def open(self):
+        mmap = lazy_import('mmap')
+        with open(self.path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+        try:
+            magic, version, _, self.count, names_length = STORE_HEADER.unpack_from(self.data, 0)
+            if magic != STORE_MAGIC or version != STORE_VERSION:
+                raise ValueError(f"not a version {STORE_VERSION} quote store")
+            names_end = STORE_HEADER.size + names_length
+            names = self.data[STORE_HEADER.size:names_end].decode('utf-8').split('\n')
+            self.bits = {category: 1 << i for i, category in enumerate(names) if category}
+            # Stores built with other categories get their masks translated to CATEGORY_BITS
+            self.mask_map = None if names == list(CATEGORY_BITS) else [
+                (1 << i, CATEGORY_BITS.get(category, 0)) for i, category in enumerate(names)
+            ]
+
+            counts = struct.unpack_from(f'<{len(names)}I', self.data, names_end)
+            self.records_start = names_end + len(names) * STORE_MEMBER.size
+            self.members = {}  # category -> (file offset of its record numbers, count)
+            offset = self.records_start + self.count * STORE_RECORD.size
+            for category, count in zip(names, counts):
+                self.members[category] = (offset, count)
+                offset += count * STORE_MEMBER.size
+            self.blob_start = offset
+            if self.blob_start > len(self.data):
+                raise ValueError("quote store is truncated")
+        except (struct.error, UnicodeDecodeError, ValueError) as e:
+            self.close()
+            raise ValueError(f"invalid quote store: {e}") from e
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+
+    def record(self, index):
+        return STORE_RECORD.unpack_from(self.data, self.records_start + index * STORE_RECORD.size)
+
+    def get(self, index):
+        """Decode quote number index as a Quote, or None if the record is corrupt"""
+        if not 0 <= index < self.count:
+            return None
+        offset, text_length, author_length, mask = self.record(index)
+        start = self.blob_start + offset
+        end = start + text_length + author_length
+        if end > len(self.data):
+            return None
+        if self.mask_map is not None:
+            mask = sum(bit for stored, bit in self.mask_map if mask & stored)
+        try:
+            return Quote(
+                self.data[start:start + text_length].decode('utf-8'),
+                self.data[start + text_length:end].decode('utf-8'),
+                mask
+            )
+        except UnicodeDecodeError:
+            return None
+
+    def choose(self, category='all'):
+        """Next quote in the category's rotation, or None if the category has none"""
+        if category == 'all':
+            members, size = None, self.count
+        else:
+            members, size = self.members.get(category, (None, 0))
+        if not size:
+            return None
+
+        rotation = self.rotations.get(category)
+        if rotation is None or rotation.size != size:
+            rotation = self.rotations[category] = RangeRotation(size)
+        index = rotation.next()
+        if members is not None:
+            index = STORE_MEMBER.unpack_from(self.data, members + index * STORE_MEMBER.size)[0]
+        return self.get(index)
+
+
+# Open QuoteStore per path, reused (with its rotations) while the file is unchanged
+QUOTE_STORES = {}
+
+
+def open_quote_store(path=QUOTE_STORE_FILE):
+    """The local QuoteStore, or None if there is none
+
+    Reopened when the file's mtime or size changes (e.g. after --ingest),
+    so a resident host serves the new quotes. Callers close() the store
+    when done so the file is not held mapped between quotes (Windows cannot
+    replace a mapped file).
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        QUOTE_STORES.pop(path, None)
+        return None
+
+    store = QUOTE_STORES.get(path)
+    try:
+        if store is None or store.signature != (stat.st_mtime_ns, stat.st_size):
+            if store is not None:
+                store.close()
+            store = QuoteStore(path)
+        elif store.data is None:
+            store.open()
+    except (OSError, ValueError) as e:
+        QUOTE_STORES.pop(path, None)
+        if DEBUG_MODE:
+            print(f"Ignoring quote store: {e}")
+        return None
+
+    QUOTE_STORES[path] = store
+    return store
+
+
+def benchmark_store(sizes=(15, 10000, 1000000), picks=1000):
+    """Show that opening the quote store and picking a quote costs the same at any size"""
+    tempfile = lazy_import('tempfile')
+    directory = tempfile.mkdtemp()
+    print(f"{'quotes':>9} {'build s':>8} {'size MB':>8} {'open us':>8} {'pick us':>8} "
+          f"{'pick motivation us':>19} {'pick creativity us':>19}")
+    try:
+        for size in sizes:
+            path = os.path.join(directory, f'store_{size}.bin')
+            start = time.perf_counter()
+            with QuoteStoreBuilder(path) as builder:
+                for i in range(size):
+                    quote = QUOTE_INDEX.quotes[i % len(FALLBACK_QUOTES)]
+                    builder.add(Quote(f'{quote.text} ({i})', quote.author, quote.mask))
+            build_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            store = QuoteStore(path)
+            open_us = (time.perf_counter() - start) * 1e6
+
+            start = time.perf_counter()
+            for _ in range(picks):
+                store.choose()
+            pick_us = (time.perf_counter() - start) * 1e6 / picks
+
+            # Motivation is common; creativity matches 1 in 15 quotes
+            category_us = []
+            for category in ('motivation', 'creativity'):
+                start = time.perf_counter()
+                for _ in range(picks):
+                    store.choose(category)
+                category_us.append((time.perf_counter() - start) * 1e6 / picks)
+            store.close()
+
+            print(f"{size:>9} {build_s:>8.2f} {os.path.getsize(path) / 1e6:>8.2f} "
+                  f"{open_us:>8.1f} {pick_us:>8.2f} {category_us[0]:>19.2f} {category_us[1]:>19.2f}")
+    finally:
+        lazy_import('shutil').rmtree(directory, ignore_errors=True)
+    return True
+
+
+def compile_settings_validator(schema):
+    """Compile a settings schema into a single validate(saved) function
+
+    Each rule becomes one small check closure, built once, so validation is a
+    single loop over the schema with no per-call lookups of allowed values.
+    validate() returns the defaults merged with every valid saved value.
+    """
+    def int_check(rule):
+        low, high = rule["min"], rule["max"]
+
+        def check(value):
+            # bool is an int subclass; reject it so true/false never become 1/0
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and low <= value <= high:
+                return int(value)
+            raise ValueError
+        return check
+
+    def choice_check(rule):
+        choices = frozenset(rule["choices"])
+
+        def check(value):
+            if isinstance(value, str) and value in choices:
+                return value
+            raise ValueError
+        return check
+
+    builders = {"int": int_check, "choice": choice_check}
+    checks = tuple((key, builders[rule["type"]](rule)) for key, rule in schema.items())
+    defaults = {key: rule["default"] for key, rule in schema.items()}
+
+    def validate(saved):
+        if not isinstance(saved, dict):
+            raise ValueError("settings file must contain a JSON object")
+        validated = dict(defaults)
+        for key, check in checks:
+            if key in saved:
+                try:
+                    validated[key] = check(saved[key])
+                except ValueError:
+                    pass  # Invalid value - keep the default
+        return validated
+
+    validate.defaults = defaults
+    return validate
+
+
+class SettingsLoader:
+    """Settings loader with a parse cache validated by file mtime and size
+
+    load() costs one os.stat() when the file is unchanged since the last
+    parse - no read, no JSON decode, no validation - and reparses only when
+    the (mtime, size) signature differs, so edits made outside the app are
+    picked up on the next load without any polling in between. Writes made
+    by SettingsStore are recorded with remember(), so the app's own saves
+    never cause a reparse. Shared by every overlay of a resident host.
+    """
+
+    def __init__(self, path=SETTINGS_FILE, schema=None):
+        self.path = path
+        self.validate = compile_settings_validator(schema or SETTINGS_SCHEMA)
+        self.signature = None  # (st_mtime_ns, st_size) of the cached parse
+        self.cached = None
+        self.lock = threading.Lock()
+        self.parses = 0
+        self.hits = 0
+
+    def stat_signature(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self):
+        """Return validated settings (a fresh dict the caller may modify)"""
+        signature = self.stat_signature()
+        with self.lock:
+            if signature is None:
+                return dict(self.validate.defaults)
+            if signature == self.signature:
+                self.hits += 1
+                return dict(self.cached)
+
+        try:
+            with open(self.path, 'r') as f:
+                settings = self.validate(json.load(f))
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"Error loading settings: {e}")
+            else:
+                print("Unable to load saved settings. Using defaults.")
+            # Cache the defaults too, so a broken file is reported once, not on every load
+            settings = dict(self.validate.defaults)
+
+        with self.lock:
+            self.parses += 1
+            self.signature, self.cached = signature, settings
+        if DEBUG_MODE:
+            print(f"Settings parsed ({self.parses} parses, {self.hits} cache hits)")
+        return dict(settings)
+
+    def remember(self, settings):
+        """Record settings just written to the file, so the next load is a hit"""
+        signature = self.stat_signature()
+        with self.lock:
+            if signature is not None:
+                self.signature, self.cached = signature, self.validate(settings)
+
+
+SETTINGS_LOADER = SettingsLoader()
+
+
+class SettingsStore:
+    """Debounced write-behind store for the settings file
+
+    save() only records the latest settings in memory and (re)arms a
+    debounce timer on the Tk loop; once changes stop for the debounce window
+    the file is written once, atomically, from an idle callback. flush()
+    writes immediately and is called when the settings window or the overlay
+    closes. Counts how many writes the coalescing avoided.
+    """
+
+    def __init__(self, root, path=SETTINGS_FILE, debounce_ms=None, loader=None):
+        self.root = root
+        self.path = path
+        self.loader = loader  # SettingsLoader whose parse cache tracks our writes
+        self.debounce_ms = debounce_ms if debounce_ms is not None else CONFIG["settings_debounce_ms"]
+        self.pending = None  # Settings waiting to be written
+        self.after_id = None
+        self.requests = 0
+        self.writes = 0
+
+    @property
+    def avoided_writes(self):
+        return self.requests - self.writes
+
+    def save(self, settings):
+        """Record a change and restart the debounce window"""
+        self.pending = dict(settings)
+        self.requests += 1
+        self.cancel_timer()
+        try:
+            self.after_id = self.root.after(
+                self.debounce_ms,
+                lambda: self.root.after_idle(self.flush)
+            )
+        except tk.TclError:
+            self.flush()  # Window already destroyed - write now
+
+    def cancel_timer(self):
+        if self.after_id:
+            try:
+                self.root.after_cancel(self.after_id)
+            except tk.TclError:
+                pass
+            self.after_id = None
+
+    def flush(self):
+        """Write pending settings now using an atomic write to prevent corruption"""
+        self.cancel_timer()
+        if self.pending is None:
+            return
+
+        settings, self.pending = self.pending, None
+        try:
+            # Replaces the old file only after the new one is complete
+            atomic_write(self.path, json.dumps(settings, indent=2))
+            self.writes += 1
+            if self.loader is not None:
+                self.loader.remember(settings)
+            if DEBUG_MODE:
+                print(f"Settings saved ({self.writes} writes, {self.avoided_writes} avoided by debouncing)")
+
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"Error saving settings: {e}")
+            else:
+                print("Unable to save settings. Changes may not persist.")
+
+
+def ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_cubic(t):
+    return t ** 3
+
+
+class Animator:
+    """Time-based animations driven by one shared frame clock
+
+    Each animation maps elapsed time (not a frame count) through an easing
+    function, so a late frame jumps ahead instead of stretching the
+    animation, and all running animations advance together on a single
+    after() chain that stops when none are left. Starting an animation under
+    a name that is already running replaces it. Frame counts, skipped frames
+    and the worst frame interval are printed in --debug mode.
+    """
+
+    def __init__(self, root, frame_ms=ANIMATION_FRAME_MS, clock=time.monotonic):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.clock = clock
+        self.animations = {}
+        self.after_id = None
+        self.last_frame = None
+
+    def animate(self, name, start, end, duration_ms, apply, easing=ease_out_cubic, on_done=None):
+        """Animate apply(value) from start to end over duration_ms"""
+        self.animations[name] = {
+            'start': start, 'end': end, 'duration': duration_ms / 1000,
+            'apply': apply, 'easing': easing, 'on_done': on_done,
+            'began': self.clock(), 'frames': 0, 'skipped': 0, 'worst_ms': 0.0,
+        }
+        if self.after_id is None:
+            self.last_frame = self.clock()
+            self.frame()
+
+    def cancel(self, name):
+        self.animations.pop(name, None)
+
+    def cancel_all(self):
+        self.animations.clear()
+        if self.after_id is not None:
+            try:
+                self.root.after_cancel(self.after_id)
+            except tk.TclError:
+                pass
+            self.after_id = None
+
+    def frame(self):
+        """Advance every animation to the current time"""
+        self.after_id = None
+        now = self.clock()
+        interval_ms = (now - self.last_frame) * 1000
+        self.last_frame = now
+
+        for name, anim in list(self.animations.items()):
+            progress = min((now - anim['began']) / anim['duration'], 1.0) if anim['duration'] > 0 else 1.0
+            value = anim['start'] + (anim['end'] - anim['start']) * anim['easing'](progress)
+            anim['frames'] += 1
+            anim['worst_ms'] = max(anim['worst_ms'], interval_ms)
+            anim['skipped'] += max(int(interval_ms / self.frame_ms) - 1, 0)
+            try:
+                anim['apply'](value)
+            except tk.TclError:
+                progress = 1.0  # Window gone - finish now
+            if progress >= 1.0:
+                self.finish(name, anim, now)
+
+        if self.animations:
+            self.after_id = self.root.after(self.frame_ms, self.frame)
+
+    def finish(self, name, anim, now):
+        if self.animations.get(name) is anim:
+            del self.animations[name]
+        if DEBUG_MODE:
+            print(f"Animation {name}: {anim['frames']} frames in {(now - anim['began']) * 1000:.0f} ms "
+                  f"({anim['skipped']} skipped, worst frame {anim['worst_ms']:.1f} ms)")
+        if anim['on_done']:
+            anim['on_done']()
+
+
+class Countdown:
+    """Auto-close countdown driven by a single monotonic deadline
+
+    Instead of polling, each wakeup is scheduled for the moment the progress
+    bar would next lose a pixel (but no sooner than PROGRESS_MIN_FRAME_MS),
+    capped at the close deadline, so the overlay closes on time and
+    on_draw(width) runs only when the bar's pixel width changes. Pausing
+    keeps the remaining time; resuming sets a new deadline from it.
+    wakeups, redraws and lateness_ms (how late the close fired) are kept
+    for tests and --debug.
+    """
+
+    def __init__(self, root, duration_ms, on_expire, on_draw=None, track_width=0,
+                 clock=time.monotonic, min_frame_ms=PROGRESS_MIN_FRAME_MS):
+        self.root = root
+        self.duration_ms = duration_ms
+        self.on_expire = on_expire
+        self.on_draw = on_draw
+        self.track_width = track_width
+        self.clock = clock
+        self.min_frame_ms = min_frame_ms
+        self.deadline = None  # clock() time the countdown ends, None when stopped
+        self.remaining_ms = duration_ms
+        self.paused = False
+        self.after_id = None
+        self.drawn_width = None
+        self.wakeups = 0
+        self.redraws = 0
+        self.lateness_ms = None
+
+    def start(self):
+        self.paused = False
+        self.remaining_ms = self.duration_ms
+        self.deadline = self.clock() + self.duration_ms / 1000
+        self.update()
+
+    def restart(self):
+        """Give the full duration again, keeping the paused state"""
+        if self.paused:
+            self.remaining_ms = self.duration_ms
+            self.draw(self.remaining_ms)
+        else:
+            self.start()
+
+    def pause(self):
+        if self.paused or self.deadline is None:
+            return
+        self.cancel_wakeup()
+        self.remaining_ms = max((self.deadline - self.clock()) * 1000, 0)
+        self.paused = True
+
+    def resume(self):
+        if not self.paused:
+            return
+        self.paused = False
+        self.deadline = self.clock() + self.remaining_ms / 1000
+        self.update()
+
+    def cancel(self):
+        self.cancel_wakeup()
+        self.deadline = None
+
+    def set_track_width(self, width):
+        """Track (full bar) width in pixels, e.g. from a <Configure> event"""
+        if width == self.track_width:
+            return
+        self.track_width = width
+        self.drawn_width = None
+        if self.paused:
+            self.draw(self.remaining_ms)
+        elif self.deadline is not None:
+            self.update()
+
+    def cancel_wakeup(self):
+        if self.after_id:
+            try:
+                self.root.after_cancel(self.after_id)
+            except tk.TclError:
+                pass
+            self.after_id = None
+
+    def wake(self):
+        self.after_id = None
+        self.wakeups += 1
+        self.update()
+
+    def update(self):
+        """Redraw if needed and schedule the next wakeup, or expire"""
+        self.cancel_wakeup()
+        remaining = (self.deadline - self.clock()) * 1000
+        if remaining <= 0:
+            self.lateness_ms = -remaining
+            self.deadline = None
+            self.draw(0)
+            if DEBUG_MODE:
+                print(f"Countdown: {self.wakeups} wakeups, {self.redraws} redraws, "
+                      f"closed {self.lateness_ms:.1f} ms after the deadline")
+            self.on_expire()
+            return
+
+        self.draw(remaining)
+        delay = remaining
+        if self.track_width > 0 and self.drawn_width:
+            # Time until the bar shrinks to drawn_width - 1 pixels
+            next_pixel = remaining - (self.drawn_width - 1) * self.duration_ms / self.track_width
+            delay = min(max(next_pixel, self.min_frame_ms), remaining)
+        self.after_id = self.root.after(max(math.ceil(delay), 1), self.wake)
+
+    def draw(self, remaining_ms):
+        """Call on_draw with the bar width for remaining_ms, if it changed"""
+        if self.track_width <= 0:
+            return
+        fraction = min(remaining_ms / self.duration_ms, 1.0) if self.duration_ms else 0.0
+        width = math.ceil(self.track_width * fraction)
+        if width != self.drawn_width:
+            self.drawn_width = width
+            self.redraws += 1
+            if self.on_draw:
+                self.on_draw(width)
+
+
+def check_countdown(duration_ms=60000, track_width=300, poll_ms=100):
+    """Run a Countdown on a simulated Tk loop and clock: wakeups, redraws and close lateness
+
+    Compares the wakeup count with the poll_ms polling the countdown
+    replaced, and checks that pausing keeps the remaining time.
+    """
+    heapq = lazy_import('heapq')
+
+    class SimulatedLoop:
+        """Just enough of Tk's after()/after_cancel() for Countdown, on a fake clock"""
+
+        def __init__(self):
+            self.now = 0.0
+            self.pending = []  # (due time, id, callback) heap
+            self.last_id = 0
+
+        def clock(self):
+            return self.now
+
+        def after(self, ms, callback):
+            self.last_id += 1
+            after_id = self.last_id
+            heapq.heappush(self.pending, (self.now + ms / 1000, after_id, callback))
+            return after_id
+
+        def after_cancel(self, after_id):
+            self.pending = [entry for entry in self.pending if entry[1] != after_id]
+            heapq.heapify(self.pending)
+
+        def run(self, until=None):
+            while self.pending and (until is None or self.pending[0][0] <= until):
+                self.now, _, callback = heapq.heappop(self.pending)
+                callback()
+            if until is not None:
+                self.now = max(self.now, until)
+
+    loop = SimulatedLoop()
+    closed = []
+    countdown = Countdown(loop, duration_ms, on_expire=lambda: closed.append(loop.now),
+                          track_width=track_width, clock=loop.clock)
+    countdown.start()
+    loop.run()
+    polls = duration_ms // poll_ms
+    print(f"{duration_ms / 1000:.0f} s timer, {track_width} px track: {countdown.wakeups} wakeups "
+          f"(polling every {poll_ms} ms: {polls}), {countdown.redraws} redraws, "
+          f"closed {countdown.lateness_ms:.2f} ms after the deadline")
+    ok = (len(closed) == 1 and countdown.lateness_ms < 1.5
+          and countdown.redraws == track_width + 1 and countdown.wakeups < polls)
+
+    # Pause at 40% for 10 s: the close moves back by exactly the pause
+    loop = SimulatedLoop()
+    closed = []
+    countdown = Countdown(loop, duration_ms, on_expire=lambda: closed.append(loop.now),
+                          track_width=track_width, clock=loop.clock)
+    countdown.start()
+    loop.run(until=duration_ms * 0.4 / 1000)
+    countdown.pause()
+    loop.run(until=loop.now + 10)
+    countdown.resume()
+    loop.run()
+    expected = duration_ms / 1000 + 10
+    paused_ok = len(closed) == 1 and abs(closed[0] - expected) < 0.0015
+    print(f"Paused 10 s: closed at {closed[0] if closed else float('nan'):.3f} s (expected {expected:.3f} s)")
+
+    ok = ok and paused_ok
+    print("Countdown OK." if ok else "Countdown check FAILED.")
+    return ok
+
+
+class FontRegistry:
+    """Shared Tk fonts and a bounded text-measurement cache
+
+    Each (family, size, weight, slant) font is created once per Tk
+    interpreter and reused, so font-size toggles and new overlays never
+    create fonts again. measure() remembers widths by font and text in an
+    LRU, so measuring a repeated quote skips the Tk round trip;
+    measure_words() caches per word so widths can be summed for new text.
+    """
+
+    def __init__(self, root, max_entries=MEASURE_CACHE_SIZE):
+        self.root = root
+        self.fonts = {}
+        self.widths = collections.OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, family=QUOTE_FONT_FAMILY, size=13, weight='normal', slant='roman'):
+        key = (family, size, weight, slant)
+        quote_font = self.fonts.get(key)
+        if quote_font is None:
+            quote_font = font.Font(root=self.root, family=family, size=size, weight=weight, slant=slant)
+            self.fonts[key] = quote_font
+        return quote_font
+
+    def measure(self, text, family=QUOTE_FONT_FAMILY, size=13, weight='normal', slant='roman'):
+        """Width of text in pixels, cached by font and text"""
+        key = (family, size, weight, slant, text)
+        width = self.widths.get(key)
+        if width is not None:
+            self.widths.move_to_end(key)
+            self.hits += 1
+            return width
+
+        self.misses += 1
+        width = self.get(family, size, weight, slant).measure(text)
+        self.widths[key] = width
+        if len(self.widths) > self.max_entries:
+            self.widths.popitem(last=False)
+        return width
+
+    def measure_words(self, words, family=QUOTE_FONT_FAMILY, size=13, weight='normal', slant='roman'):
+        """Cached widths of each word, for summing into line widths"""
+        return [self.measure(word, family, size, weight, slant) for word in words]
+
+    def linespace(self, family=QUOTE_FONT_FAMILY, size=13, weight='normal', slant='roman'):
+        """Line height in pixels (cached with the font)"""
+        key = (family, size, weight, slant, None)
+        height = self.widths.get(key)
+        if height is None:
+            height = self.get(family, size, weight, slant).metrics('linespace')
+            self.widths[key] = height
+        return height
+
+
+QuoteLayout = collections.namedtuple('QuoteLayout', 'width height wraplength lines font_size')
+
+
+def wrap_words(word_widths, space_width, wraplength):
+    """Greedy line breaking the way a Tk label wraps
+
+    Returns (first word, end word, width) for each line.
+    """
+    lines = []
+    start = 0
+    line = None
+    for index, width in enumerate(word_widths):
+        if line is None:
+            line = width
+        elif line + space_width + width <= wraplength:
+            line += space_width + width
+        else:
+            lines.append((start, index, line))
+            start, line = index, width
+    lines.append((start, len(word_widths), line or 0))
+    return lines
+
+
+def layout_quote(fonts, quote_text, author, font_size=FONT_SIZES["medium"]):
+    """Compute the overlay's width, height and quote wrapping in one measured pass
+
+    Measures each word once (cached by FontRegistry) and derives the window
+    width from the single-line width, then breaks lines at the resulting
+    wraplength and sums the rows create_widgets packs. The same dimensions
+    are used for the window geometry and the gradient, so neither needs a
+    second Tk geometry pass.
+    """
+    padding = CONFIG["window_padding"]
+    words = f'"{quote_text}"'.split()
+    word_widths = fonts.measure_words(words, size=font_size)
+    space_width = fonts.measure(' ', size=font_size)
+
+    # Width: quote on one line plus padding, clamped to the responsive bounds
+    text_width = sum(word_widths) + space_width * max(len(words) - 1, 0)
+    width = max(MIN_WINDOW_WIDTH, min(text_width + padding * 2 + 60, MAX_WINDOW_WIDTH))
+    wraplength = width - padding * 2 - 30
+    # Tk breaks a word wider than the label across rows
+    lines = sum(max(math.ceil(line / wraplength), 1) for _, _, line in wrap_words(word_widths, space_width, wraplength))
+
+    # Height: the rows packed by create_widgets, top to bottom.
+    # Each label adds its border and internal padding (2 px per side).
+    label_chrome = 4
+    height = (
+        1 + 4                                                              # border, accent bar
+        + padding + 30                                                     # button row
+        + lines * fonts.linespace(size=font_size) + label_chrome + 10      # quote
+        + fonts.linespace(size=12, slant='italic') + label_chrome + 8      # author
+        + 4 + fonts.linespace(size=9, slant='italic') + label_chrome + 6   # hint
+        + 6 + 2                                                            # progress bar
+        + padding + 1                                                      # content padding, border
+    )
+    return QuoteLayout(width, max(height, MIN_WINDOW_HEIGHT), wraplength, lines, font_size)
+
+
+# Card buttons right of the close button: tag and right-edge offset from the close button column
+CARD_BUTTONS = (('theme_btn', 35), ('settings_btn', 95))
+
+
+def card_geometry(layout, fonts):
+    """Pixel positions of every element of the quote card, as create_widgets packs them
+
+    Shared by the canvas renderer and the headless card renderer. Boxes are
+    (x0, y0, x1, y1) with exclusive right/bottom edges; points are text
+    anchors (quote: top-left, author: top-right, hint: top-center,
+    close button and button labels: center).
+    """
+    width, height = layout.width, layout.height
+    padding = CONFIG["window_padding"]
+    left, right = 1 + padding, width - 1 - padding
+    geometry = {'top_bar': (1, 1, width - 1, 5)}
+
+    # Button row, right-aligned like the placed buttons
+    middle = 5 + padding + 15
+    geometry['close_btn'] = (right - 8, middle)
+    button_height = fonts.linespace(size=8, weight='bold') + 8
+    for tag, offset in CARD_BUTTONS:
+        # Wide enough for every label the button can show, plus padx=8 per side
+        labels = THEME_TOGGLE_LABELS.values() if tag == 'theme_btn' else ('Settings',)
+        x1 = right - offset
+        x0 = x1 - max(fonts.measure(label, size=8, weight='bold') for label in labels) - 16
+        geometry[tag] = (x0, middle - button_height / 2, x1, middle + button_height / 2)
+        geometry[f'{tag}_text'] = ((x0 + x1) / 2, middle)
+
+    # Text rows; each label in the widget tree adds 2 px of chrome per side
+    y = 5 + padding + 30 + 2
+    geometry['quote'] = (left + 2, y)
+    y += layout.lines * fonts.linespace(size=layout.font_size) + 2 + 10 + 2
+    geometry['author'] = (right - 2, y)
+    y += fonts.linespace(size=12, slant='italic') + 2 + 8 + 4 + 2
+    geometry['hint'] = (width / 2, y)
+
+    # Progress bar along the bottom padding
+    bottom = height - 1 - padding
+    geometry['progress'] = (left, bottom - 2, right, bottom)
+    return geometry
+
+
+# Headless card renderer: TrueType files tried for each (weight, slant), Segoe UI first.
+# Falls back to Pillow's built-in font when none is installed.
+CARD_FONT_FILES = {
+    ('normal', 'roman'): ('segoeui.ttf', 'DejaVuSans.ttf'),
+    ('bold', 'roman'): ('segoeuib.ttf', 'DejaVuSans-Bold.ttf'),
+    ('normal', 'italic'): ('segoeuii.ttf', 'DejaVuSans-Oblique.ttf'),
+}
+TK_POINTS_TO_PIXELS = 96 / 72  # Tk font sizes are points; cards are rendered at 96 dpi
+
+# Rendered PNG quote cards (--render-cards), stored next to the settings file
+CARD_OUTPUT_DIR = os.path.join(os.path.dirname(SETTINGS_FILE), 'quote_cards')
+
+
+class CardFonts:
+    """Pillow stand-in for FontRegistry, so layout_quote() works without a display"""
+
+    def __init__(self):
+        self.fonts = {}
+        self.widths = {}
+
+    def get(self, family=QUOTE_FONT_FAMILY, size=13, weight='normal', slant='roman'):
+        key = (size, weight, slant)
+        card_font = self.fonts.get(key)
+        if card_font is None:
+            ImageFont = lazy_import('PIL.ImageFont')
+            pixels = round(size * TK_POINTS_TO_PIXELS)
+            # Any missing style falls back to the regular face before Pillow's
+            # built-in font, which has no em dash for the author line
+            regular = CARD_FONT_FILES[('normal', 'roman')]
+            for filename in (*CARD_FONT_FILES.get((weight, slant), ()), *regular):
+                try:
+                    card_font = ImageFont.truetype(filename, pixels)
+                    break
+                except OSError:
+                    continue
+            else:
+                card_font = ImageFont.load_default(pixels)
+            self.fonts[key] = card_font
+        return card_font
+
+    def measure(self, text, family=QUOTE_FONT_FAMILY, size=13, weight='normal', slant='roman'):
+        key = (size, weight, slant, text)
+        width = self.widths.get(key)
+        if width is None:
+            width = self.widths[key] = round(self.get(family, size, weight, slant).getlength(text))
+        return width
 
-def create_diagonal_gradient(width, height, color1, color2):
-    """
-    Create a diagonal gradient image (top-left to bottom-right) using PIL.
-    Optimized version using numpy-like array operations.
+    def measure_words(self, words, family=QUOTE_FONT_FAMILY, size=13, weight='normal', slant='roman'):
+        return [self.measure(word, family, size, weight, slant) for word in words]
 
-    Args:
-        width: Image width in pixels
-        height: Image height in pixels
-        color1: Starting color (hex string like '#faf8f5')
-        color2: Ending color (hex string like '#f3ede6')
+    def linespace(self, family=QUOTE_FONT_FAMILY, size=13, weight='normal', slant='roman'):
+        ascent, descent = self.get(family, size, weight, slant).getmetrics()
+        return ascent + descent
 
-    Returns:
-        PIL Image object with diagonal gradient, or None if PIL unavailable or invalid size
-    """
-    if not PIL_AVAILABLE:
-        # Fallback: solid color image
-        return None
 
-    # SECURITY: Validate image dimensions to prevent excessive memory usage
-    MAX_WIDTH = 1920   # Full HD width
-    MAX_HEIGHT = 1080  # Full HD height
+def render_quote_card(quote_data, theme='light', font_size='medium', fonts=None):
+    """Render the overlay for a quote as a PIL image, without Tk or a display
 
-    if width <= 0 or height <= 0 or width > MAX_WIDTH or height > MAX_HEIGHT:
-        print(f"Warning: Invalid gradient size {width}x{height}, using fallback")
-        return None
+    Uses the same layout, geometry, theme colors and gradient as the
+    on-screen overlay (as drawn by the canvas renderer, gradient showing
+    through), with the progress bar full as at first paint.
+    """
+    fonts = fonts or CardFonts()
+    ImageDraw = lazy_import('PIL.ImageDraw')
+    colors = THEMES.get(theme, THEMES['light'])
+    layout = layout_quote(fonts, quote_data.text, quote_data.author,
+                          FONT_SIZES.get(font_size, FONT_SIZES["medium"]))
+    geometry = card_geometry(layout, fonts)
+
+    image = create_diagonal_gradient(layout.width, layout.height, colors['bg'], colors['bg_gradient'])
+    if image is None:
+        image = lazy_import('PIL.Image').new('RGB', (layout.width, layout.height), colors['window_bg'])
+    draw = ImageDraw.Draw(image)
+
+    def box(x0, y0, x1, y1):
+        return (x0, y0, x1 - 1, y1 - 1)  # Pillow boxes include the right/bottom edge
+
+    draw.rectangle((0, 0, layout.width - 1, layout.height - 1), outline=colors['border'])
+    draw.rectangle(box(*geometry['top_bar']), fill=colors['accent'])
+    draw.text(geometry['close_btn'], '×', font=fonts.get(size=18, weight='bold'), fill=colors['hint'], anchor='rm')
+    labels = {'theme_btn': THEME_TOGGLE_LABELS.get(theme, 'Dark'), 'settings_btn': 'Settings'}
+    for tag, _ in CARD_BUTTONS:
+        draw.rectangle(box(*geometry[tag]), fill=colors['accent'])
+        draw.text(geometry[f'{tag}_text'], labels[tag], font=fonts.get(size=8, weight='bold'),
+                  fill='white', anchor='mm')
+
+    # Quote, wrapped exactly as layout_quote() measured it
+    quote_font = fonts.get(size=layout.font_size)
+    words = f'"{quote_data.text}"'.split()
+    x, y = geometry['quote']
+    line_height = fonts.linespace(size=layout.font_size)
+    word_widths = fonts.measure_words(words, size=layout.font_size)
+    space_width = fonts.measure(' ', size=layout.font_size)
+    for start, end, _ in wrap_words(word_widths, space_width, layout.wraplength):
+        draw.text((x, y), ' '.join(words[start:end]), font=quote_font, fill=colors['text'], anchor='la')
+        y += line_height
+
+    draw.text(geometry['author'], f'— {quote_data.author}', font=fonts.get(size=12, slant='italic'),
+              fill=colors['author'], anchor='ra')
+    draw.text(geometry['hint'], 'Click quote to learn more', font=fonts.get(size=9, slant='italic'),
+              fill=colors['hint'], anchor='ma')
+    draw.rectangle(box(*geometry['progress']), fill=colors['accent'])
+    return image
 
-    # Convert hex to RGB
-    def hex_to_rgb(hex_color):
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
-    rgb1 = hex_to_rgb(color1)
-    rgb2 = hex_to_rgb(color2)
+@functools.lru_cache(maxsize=None)
+def card_fonts():
+    """One CardFonts per process, shared by every card a worker renders"""
+    return CardFonts()
 
-    # Create image with putdata for better performance
-    image = Image.new('RGB', (width, height))
 
-    # Maximum distance is diagonal length
-    max_distance = (width**2 + height**2) ** 0.5
+def render_card_file(job):
+    """Process-pool worker: render one card to PNG, returning (path, render ms, save ms)"""
+    quote_data, theme, font_size, path = job
+    start = time.perf_counter()
+    image = render_quote_card(quote_data, theme, font_size, fonts=card_fonts())
+    rendered = time.perf_counter()
+    image.save(path, 'PNG')
+    return path, (rendered - start) * 1000, (time.perf_counter() - rendered) * 1000
 
-    # Pre-calculate all pixel colors
-    pixels = []
-    for y in range(height):
-        for x in range(width):
-            # Calculate distance from top-left corner (0,0)
-            distance = (x**2 + y**2) ** 0.5
-            # Normalize to 0-1 range
-            ratio = min(distance / max_distance, 1.0)
 
-            # Interpolate between colors
-            r = int(rgb1[0] + (rgb2[0] - rgb1[0]) * ratio)
-            g = int(rgb1[1] + (rgb2[1] - rgb1[1]) * ratio)
-            b = int(rgb1[2] + (rgb2[2] - rgb1[2]) * ratio)
+def render_cards(output_dir=CARD_OUTPUT_DIR, quotes=None, themes=tuple(THEMES), font_size=None, workers=None):
+    """Render quote cards to PNG in parallel on a process pool and report per-card render time
 
-            pixels.append((r, g, b))
+    Defaults to the fallback quotes plus the local quote pool, in every
+    theme, at the saved font size.
+    """
+    if not PIL_AVAILABLE:
+        print("Pillow is required to render quote cards.")
+        return False
 
-    # Apply all pixels at once (much faster than point-by-point)
-    image.putdata(pixels)
+    if quotes is None:
+        quotes = QUOTE_INDEX.quotes[:len(FALLBACK_QUOTES)] + list(QuotePool().live.values())
+    font_size = font_size or SETTINGS_LOADER.load()["fontSize"]
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [
+        (quote, theme, font_size, os.path.join(output_dir, f'card_{index:05d}_{theme}.png'))
+        for index, quote in enumerate(quotes) for theme in themes
+    ]
 
-    return image
+    workers = workers or os.cpu_count() or 1
+    futures = lazy_import('concurrent.futures')
+    start = time.perf_counter()
+    render_times = []
+    with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for path, render_ms, save_ms in executor.map(render_card_file, jobs,
+                                                     chunksize=max(len(jobs) // (workers * 4), 1)):
+            render_times.append(render_ms)
+            print(f"{os.path.basename(path)}  render {render_ms:6.2f} ms  png {save_ms:6.2f} ms")
+    elapsed = time.perf_counter() - start
+
+    if render_times:
+        render_times.sort()
+        p95 = render_times[min(int(len(render_times) * 0.95), len(render_times) - 1)]
+        print(f"{len(render_times)} cards in {elapsed:.2f} s on {workers} processes "
+              f"({len(render_times) / elapsed:.0f} cards/s); render mean "
+              f"{sum(render_times) / len(render_times):.2f} ms, p95 {p95:.2f} ms -> {output_dir}")
+    return True
 
 
 class QuoteOverlay:
-    def __init__(self):
-        self.root = tk.Tk()
-        self.timer_id = None
-        self.is_paused = False
-        self.start_time = None
-        self.remaining_time = CONFIG["timer_duration"]
+    def __init__(self, master=None, quote_pool=None, quote_client=None, gradient_cache=None, fonts=None,
+                 on_close=None):
+        """Create and show an overlay
+
+        Standalone overlays own the Tk root. A resident QuoteHost passes its
+        hidden root as master (the overlay becomes a Toplevel) and shares its
+        warm quote pool, API client, gradient cache and fonts; on_close is then called
+        with the overlay once it has faded out.
+        """
+        self.init_start = time.perf_counter()
+        with TRACER.span('tk init'):
+            self.root = tk.Tk() if master is None else tk.Toplevel(master)
+        self.owns_root = master is None
+        self.on_close = on_close
+        self.closed = False
+        self.alpha = 0.0
+        self.animator = Animator(self.root)
         self.settings_window = None
+        self.gradient_cache = gradient_cache if gradient_cache is not None else GradientCache()
+        self.quote_pool = quote_pool if quote_pool is not None else QuotePool(index=QUOTE_INDEX)
+        self.quote_client = quote_client if quote_client is not None else QuoteClient()
+        self.fonts = fonts if fonts is not None else FontRegistry(self.root)
+        self.settings_store = SettingsStore(self.root, loader=SETTINGS_LOADER)
 
         # Widget references for theming
-        self.widgets = {}
+        self.widgets = {'root': self.root}
+        self.gradient_photos = {}  # (theme, width, height) -> PhotoImage
+        self.painted = False
+        self.fade_pending = False  # Fade in once the first frame is drawn
 
         # Load user settings
-        self.settings = self.load_settings()
+        with TRACER.span('load settings'):
+            self.settings = self.load_settings()
 
         # Apply settings to CONFIG
         CONFIG["timer_duration"] = self.settings["timerDuration"] * 1000  # Convert to ms
 
-        # Update remaining time
-        self.remaining_time = CONFIG["timer_duration"]
+        # Auto-close countdown (started once the progress bar exists)
+        self.countdown = Countdown(
+            self.root, CONFIG["timer_duration"],
+            on_expire=self.close_quote, on_draw=self.draw_progress
+        )
 
         # Setup window
-        self.setup_window()
+        with TRACER.span('setup window'):
+            self.setup_window()
 
-        # Fetch and display quote
-        quote_data = self.get_quote()
+        # Serve the quote from the local pool; if it is empty, show a fallback
+        # immediately and let the API quote replace it if it arrives in time
+        with TRACER.span('select quote'):
+            category = self.settings.get('category', 'motivation')
+            pooled_quote = self.quote_pool.take(category)
+            quote_data = pooled_quote or self.get_fallback_quote(category)
 
-        # Calculate responsive window width based on quote length
-        window_width = self.calculate_window_width(quote_data["text"])
-        CONFIG["window_width"] = window_width  # Update config for this quote
+        # Lay out the quote once: window size, wrapping and gradient size
+        with TRACER.span('measure text'):
+            self.layout = self.layout_quote(quote_data)
+        CONFIG["window_width"] = self.layout.width  # Update config for this quote
 
-        self.create_widgets(quote_data)
+        with TRACER.span('create widgets'):
+            self.create_widgets(quote_data)
 
         # Apply saved settings (position, fontSize, theme)
-        self.apply_position(self.settings["position"], window_width)
-        self.apply_font_size(self.settings["fontSize"])
-        self.apply_theme(self.settings["theme"])
+        with TRACER.span('apply settings'):
+            self.apply_position(self.settings["position"])
+            self.apply_font_size(self.settings["fontSize"])
+            self.apply_theme(self.settings["theme"])
+
+        # Idle callbacks run after Tk's pending redraws, i.e. after the first frame
+        self.first_paint_start = time.perf_counter()
+        self.root.after_idle(self.on_first_paint)
 
         # Start timer
         self.start_timer()
 
-    def load_settings(self):
-        """Load settings from JSON file with validation"""
-        defaults = {
-            "timerDuration": 15,
-            "position": "bottomRight",
-            "fontSize": "medium",
-            "category": "motivation",
-            "theme": "light"
-        }
-
-        try:
-            if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, 'r') as f:
-                    saved = json.load(f)
-
-                    # SECURITY: Validate all settings values before using them
-                    validated = {}
-
-                    # Validate timerDuration (must be int/float in range 5-60)
-                    if 'timerDuration' in saved:
-                        timer = saved['timerDuration']
-                        if isinstance(timer, (int, float)) and 5 <= timer <= 60:
-                            validated['timerDuration'] = int(timer)
-
-                    # Validate position (must be one of allowed values)
-                    if 'position' in saved:
-                        allowed_positions = ['bottomRight', 'bottomLeft', 'topRight', 'topLeft']
-                        if saved['position'] in allowed_positions:
-                            validated['position'] = saved['position']
-
-                    # Validate fontSize (must be one of allowed values)
-                    if 'fontSize' in saved:
-                        allowed_sizes = ['small', 'medium', 'large']
-                        if saved['fontSize'] in allowed_sizes:
-                            validated['fontSize'] = saved['fontSize']
-
-                    # Validate category (must be one of allowed categories)
-                    if 'category' in saved:
-                        allowed_categories = ['motivation', 'learning', 'creativity', 'productivity', 'all']
-                        if saved['category'] in allowed_categories:
-                            validated['category'] = saved['category']
-
-                    # Validate theme (must be light or dark)
-                    if 'theme' in saved:
-                        if saved['theme'] in ['light', 'dark']:
-                            validated['theme'] = saved['theme']
-
-                    # Merge validated settings with defaults
-                    return {**defaults, **validated}
-        except Exception as e:
-            if DEBUG_MODE:
-                print(f"Error loading settings: {e}")
-            else:
-                print("Unable to load saved settings. Using defaults.")
+        # Fetch the API quote in the background if the pool had nothing to offer
+        fetch_worker = None if pooled_quote else self.start_quote_fetch()
+
+        # Top up the local pool for future launches, once the fetch is done with the API
+        threading.Thread(
+            target=self.refill_quote_pool, args=(fetch_worker,), name='quote-pool-refill', daemon=True
+        ).start()
+
+    def on_first_paint(self):
+        """Start the fade-in and close the startup trace once the first frame has been drawn"""
+        first_paint = time.perf_counter()
+        self.painted = True
+        if self.fade_pending:
+            self.fade_pending = False
+            self.fade_in()
+        self.root.after_idle(self.prerender_gradients)
+        # Build the settings window once the fade-in is over, so opening it is just a map
+        self.root.after(FADE_IN_MS, lambda: self.root.after_idle(self.build_settings_window))
+        TRACER.add('first paint', self.first_paint_start, first_paint)
+        TRACER.add('QuoteOverlay startup', self.init_start, first_paint, category='overlay')
+        if DEBUG_MODE:
+            TRACER.print_startup_report(first_paint)
+        TRACER.write()
 
-        return defaults
+    def load_settings(self):
+        """Load validated settings (see SETTINGS_SCHEMA and SettingsLoader)"""
+        return SETTINGS_LOADER.load()
 
     def save_settings(self):
-        """Save settings to JSON file using atomic write to prevent corruption"""
-        tmp_path = None
-        try:
-            # Write to temporary file first (atomic write pattern)
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                delete=False,
-                dir=os.path.dirname(SETTINGS_FILE),
-                suffix='.tmp'
-            ) as tmp:
-                json.dump(self.settings, tmp, indent=2)
-                tmp_path = tmp.name
-
-            # Atomic rename (replaces old file only after new one is complete)
-            shutil.move(tmp_path, SETTINGS_FILE)
-
-        except Exception as e:
-            if DEBUG_MODE:
-                print(f"Error saving settings: {e}")
-            else:
-                print("Unable to save settings. Changes may not persist.")
-            # Clean up temporary file if it exists
-            if tmp_path and os.path.exists(tmp_path):
-                try:
-                    os.remove(tmp_path)
-                except:
-                    pass  # Best effort cleanup
-
-    def calculate_window_width(self, quote_text):
-        """Calculate optimal window width based on quote text length"""
-        # Create a temporary font to measure text
-        temp_font = font.Font(family='Segoe UI', size=13, weight='normal')
-
-        # Measure the text width
-        text_width = temp_font.measure(f'"{quote_text}"')
-
-        # Add padding (left + right + extra space)
-        total_width = text_width + (CONFIG["window_padding"] * 2) + 60
-
-        # Apply constraints: min 320px, max 800px
-        window_width = max(320, min(total_width, 800))
-
-        return window_width
+        """Queue the current settings for a debounced write (see SettingsStore)"""
+        self.settings_store.save(self.settings)
+
+    def layout_quote(self, quote_data):
+        """Measure the quote at the current font size (see layout_quote())"""
+        font_size = FONT_SIZES.get(self.settings.get("fontSize"), FONT_SIZES["medium"])
+        return layout_quote(self.fonts, quote_data.text, quote_data.author, font_size)
+
+    def update_layout(self):
+        """Re-measure the current quote and resize the text, gradient and window"""
+        self.layout = self.layout_quote(self.quote_data)
+        CONFIG["window_width"] = self.layout.width
+        self.render_quote()
+        self.update_gradient()
+        self.apply_position(self.settings["position"])
+
+    def render_quote(self):
+        """Show the current quote with the current layout's wrapping and font"""
+        self.quote_label.configure(
+            text=f'"{self.quote_data.text}"',
+            wraplength=self.layout.wraplength,
+            font=self.fonts.get(size=self.layout.font_size)
+        )
+        self.widgets['author_label'].configure(text=f'— {self.quote_data.author}')
 
-    def apply_position(self, position, window_width=None):
-        """Apply window position based on settings"""
-        if window_width is None:
-            window_width = CONFIG.get("window_width", 340)
+    def apply_position(self, position):
+        """Apply window position based on settings, at the laid-out size"""
+        window_width, window_height = self.layout.width, self.layout.height
 
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
-        window_height = 200
 
         if position == "bottomRight":
             x = screen_width - window_width - CONFIG["corner_offset"]
@@ -452,90 +3158,22 @@ class QuoteOverlay:
         self.root.geometry(f'{window_width}x{window_height}+{x}+{y}')
 
     def apply_font_size(self, size):
-        """Apply font size to quote label"""
-        if hasattr(self, 'quote_label'):
-            size_map = {
-                "small": 11,
-                "medium": 13,
-                "large": 15
-            }
-            font_size = size_map.get(size, 13)
-            quote_font = font.Font(family='Segoe UI', size=font_size, weight='normal')
-            self.quote_label.configure(font=quote_font)
+        """Apply font size to the quote, re-laying out the window if it changed"""
+        if FONT_SIZES.get(size, FONT_SIZES["medium"]) != self.layout.font_size:
+            self.update_layout()
 
     def apply_theme(self, theme='light'):
-        """Apply theme colors to all widgets"""
-        colors = THEMES.get(theme, THEMES['light'])
-
-        # Update root window
-        self.root.configure(bg=colors['window_bg'])
-
-        # Update all stored widgets
-        if 'main_frame' in self.widgets:
-            self.widgets['main_frame'].configure(
-                bg=colors['window_bg'],
-                highlightbackground=colors['border']
-            )
-
-        if 'top_bar' in self.widgets:
-            self.widgets['top_bar'].configure(bg=colors['accent'])
-
-        if 'button_frame' in self.widgets:
-            self.widgets['button_frame'].configure(bg=colors['window_bg'])
-
-        if 'content_frame' in self.widgets:
-            self.widgets['content_frame'].configure(bg=colors['window_bg'])
-
-        if 'settings_btn' in self.widgets:
-            self.widgets['settings_btn'].configure(
-                bg=colors['accent'],
-                fg='white',
-                activebackground=colors['accent_hover'],
-                activeforeground='white'
-            )
-
-        if 'theme_btn' in self.widgets:
-            # Update theme button text - shows opposite of current theme
-            button_text = 'Dark' if theme == 'light' else 'Light'
-            self.widgets['theme_btn'].configure(
-                text=button_text,
-                bg=colors['accent'],
-                fg='white',
-                activebackground=colors['accent_hover'],
-                activeforeground='white'
-            )
-
-        if 'close_btn' in self.widgets:
-            self.widgets['close_btn'].configure(
-                fg=colors['hint'],
-                bg=colors['window_bg'],
-                activebackground=colors['close_hover_bg'],
-                activeforeground=colors['close_hover_fg']
-            )
-
-        if hasattr(self, 'quote_label'):
-            self.quote_label.configure(
-                fg=colors['text'],
-                bg=colors['window_bg']
-            )
-
-        if 'author_label' in self.widgets:
-            self.widgets['author_label'].configure(
-                fg=colors['author'],
-                bg=colors['window_bg']
-            )
-
-        if 'hint_label' in self.widgets:
-            self.widgets['hint_label'].configure(
-                fg=colors['hint'],
-                bg=colors['window_bg']
-            )
-
-        if 'progress_frame' in self.widgets:
-            self.widgets['progress_frame'].configure(bg=colors['progress_bg'])
-
-        if 'progress_bar' in self.widgets:
-            self.widgets['progress_bar'].configure(bg=colors['accent'])
+        """Apply theme colors to all widgets in one pass over the compiled styles"""
+        styles = THEME_STYLES.get(theme, THEME_STYLES['light'])
+        for name, options in styles.items():
+            widget = self.widgets.get(name)
+            if widget is not None:
+                widget.configure(**options)
+
+        # Swap in the pre-rendered gradient for this theme
+        gradient_label = self.widgets.get('gradient_bg')
+        if gradient_label is not None:
+            gradient_label.configure(image=self.gradient_photo(theme))
 
     def toggle_theme(self):
         """Toggle between light and dark themes"""
@@ -557,201 +3195,242 @@ class QuoteOverlay:
         self.root.attributes('-topmost', True)  # Always on top
         self.root.configure(bg=colors['window_bg'])
 
-        # Set transparency for modern look
-        try:
-            self.root.attributes('-alpha', WINDOW_OPACITY)
-        except:
-            pass  # Some systems don't support alpha
-
         # Note: Position will be set by apply_position() in __init__
 
-        # Fade in animation
-        self.root.attributes('-alpha', 0.0)
-        self.fade_in()
+        # Start transparent; on_first_paint() fades in to WINDOW_OPACITY (a slight
+        # transparency for modern look) so the widget work before it can't eat the fade
+        try:
+            self.set_alpha(0.0)
+        except tk.TclError:
+            return  # Some systems don't support alpha
+        self.fade_pending = True
+
+    def set_alpha(self, alpha):
+        """Set window opacity, remembering it so animations never read it back from Tk"""
+        self.alpha = alpha
+        self.root.attributes('-alpha', alpha)
 
-    def fade_in(self, alpha=0.0):
+    def fade_in(self):
         """Fade in animation - snappy and fast (V5.0.0)"""
-        if alpha < WINDOW_OPACITY:
-            alpha += FADE_IN_STEP
-            try:
-                self.root.attributes('-alpha', alpha)
-                self.root.after(FADE_IN_DELAY_MS, lambda: self.fade_in(alpha))
-            except:
-                pass
+        self.animator.animate('fade_in', self.alpha, WINDOW_OPACITY, FADE_IN_MS, self.set_alpha)
 
     def fade_out(self):
         """Fade out animation then close - snappy and fast (V5.0.0)"""
-        current_alpha = self.root.attributes('-alpha')
-        if current_alpha > 0:
-            new_alpha = current_alpha - FADE_OUT_STEP
-            try:
-                self.root.attributes('-alpha', new_alpha)
-                self.root.after(FADE_OUT_DELAY_MS, self.fade_out)
-            except:
-                self.root.quit()
-        else:
+        self.animator.cancel('fade_in')
+        self.animator.animate(
+            'fade_out', self.alpha, 0.0, FADE_OUT_MS, self.set_alpha,
+            easing=ease_in_cubic, on_done=self.close_window
+        )
+
+    def close_window(self):
+        """End the overlay: stop the main loop, or destroy the Toplevel when hosted"""
+        self.closed = True
+        self.countdown.cancel()
+        self.animator.cancel_all()
+        # Write any change still inside the debounce window before its after() dies with the window
+        self.settings_store.flush()
+
+        if self.owns_root:
             self.root.quit()
+            return
 
-    def matches_category(self, quote_text, category='all'):
-        """Check if a quote matches the selected category using word-boundary matching"""
-        if category == 'all':
-            return True
+        try:
+            self.root.destroy()
+        except tk.TclError:
+            pass  # Already destroyed
+        if self.on_close:
+            self.on_close(self)
+
+    @traced('fetch api quote', 'network')
+    def fetch_api_quote(self, selected_category, deadline=None):
+        """Fetch a quote matching the category from the API, or None on failure
+
+        Each request fetches a whole page; the quote is picked from the page
+        and the rest go into the local quote pool (up to its high watermark)
+        to serve later launches. Safe to call from a worker thread: it does
+        not touch any Tk state. Stops once the optional time.monotonic()
+        deadline passes.
+        """
+        max_attempts = 3  # Try up to 3 pages to find a quote matching the category
 
-        keywords = CATEGORY_KEYWORDS.get(category, [])
-        if not keywords:
-            return True
+        for _ in range(max_attempts):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
 
-        # Use word-boundary matching to avoid false positives
-        for keyword in keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', quote_text, re.IGNORECASE):
-                return True
+            items = self.quote_client.fetch_page(deadline=deadline)
+            if items is None:
+                break
 
-        return False
+            # Pick from the page itself: a full pool must not swallow the match
+            batch = parse_quote_page(items)
+            matching = [quote for quote in batch if quote.matches(selected_category)]
+            quote_data = random.choice(matching) if matching else None
+            self.quote_pool.add([quote for quote in batch if quote is not quote_data])
+            if quote_data:
+                return quote_data
+
+        return None
+
+    @traced('refill quote pool', 'network')
+    def refill_quote_pool(self, after=None):
+        """Top up the local quote pool from the bulk API endpoint (worker thread)
 
-    def normalize_text(self, text):
-        """Normalize text to fix capitalization issues
-
-        Handles:
-        - ALL CAPS words: "HELLO WORLD" → "Hello world"
-        - ALL CAPS with apostrophes: "WHO'S THERE" → "Who's there"
-        - Interior capitals: "HeLLo" → "Hello"
-        - Capitals after apostrophes: "It'S" → "It's"
-        - Proper sentence capitalization (only first word capitalized)
-        - Preserves punctuation (!, ?, ..., etc.)
-        - Properly handles both straight (') and curly (') quotes
+        Waits for the optional thread after (the launch's API fetch) first,
+        so the two never request the same page at once and the fetch's
+        additions are saved here. Fetches only when the pool is below the
+        low watermark, then pages until it reaches the high watermark. Does
+        not touch any Tk state.
         """
-        # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        # Split into sentences using pre-compiled pattern
-        sentences = SENTENCE_SPLIT_PATTERN.split(text) if SENTENCE_SPLIT_PATTERN.search(text) else [text]
-
-        cleaned_sentences = []
-
-        for sentence in sentences:
-            words = sentence.split()
-            fixed_words = []
-
-            for word_idx, word in enumerate(words):
-                # Step 1: Check if word is ALL CAPS
-                # Extract only alphabetic characters to check
-                alpha_chars = [c for c in word if c.isalpha()]
-
-                if alpha_chars and len(alpha_chars) > 1 and all(c.isupper() for c in alpha_chars):
-                    # ALL CAPS word (like "HELLO" or "WHO'S") - lowercase everything
-                    word = word.lower()
-
-                # Step 2: Fix interior capitals
-                # Process character by character to handle apostrophes correctly
-                new_chars = []
-                for char_idx, char in enumerate(word):
-                    if char_idx == 0:
-                        # Lowercase first char for now (will capitalize later if needed)
-                        new_chars.append(char.lower() if char.isalpha() else char)
-                    elif char.isupper() and char.isalpha():
-                        # Check if previous char was apostrophe
-                        if char_idx > 0 and word[char_idx - 1] in ["'", "'"]:
-                            # Capital after apostrophe - lowercase it (fixes "It'S" → "It's")
-                            new_chars.append(char.lower())
-                        else:
-                            # Interior capital not after apostrophe - lowercase it
-                            new_chars.append(char.lower())
-                    else:
-                        new_chars.append(char)
+        if after is not None:
+            after.join()
 
-                word = ''.join(new_chars)
+        pool = self.quote_pool
+        if len(pool) >= CONFIG["quote_pool_low_watermark"]:
+            if pool.dirty:
+                pool.save()
+            return
 
-                # Step 3: Capitalize first letter ONLY if this is the first word in sentence
-                if word_idx == 0:
-                    for i, char in enumerate(word):
-                        if char.isalpha():
-                            word = word[:i] + word[i].upper() + word[i+1:]
-                            break
+        for _ in range(5):
+            if len(pool) >= CONFIG["quote_pool_high_watermark"]:
+                break
 
-                fixed_words.append(word)
+            items = self.quote_client.fetch_page()
+            if items is None:
+                break
 
-            cleaned_sentences.append(' '.join(fixed_words))
+            added = pool.add(parse_quote_page(items))
+            if DEBUG_MODE:
+                print(f"Quote pool refill: +{added} quotes (pool size {len(pool)})")
 
-        return ' '.join(cleaned_sentences)
+        if pool.dirty:
+            pool.save()
 
-    def get_quote(self):
-        """Fetch quote from API with fallback, filtering by selected category"""
-        max_attempts = 5  # Try up to 5 times to get a quote matching the category
-        selected_category = self.settings.get('category', 'motivation')
+    def start_quote_fetch(self):
+        """Fetch the API quote on a worker thread and poll for it from the Tk loop; returns the thread"""
+        self.quote_queue = queue.Queue()
+        self.fetch_deadline = time.monotonic() + CONFIG["quote_fetch_deadline"]
+        category = self.settings.get('category', 'motivation')
 
-        for attempt in range(max_attempts):
-            try:
-                response = requests.get(CONFIG["api_url"], timeout=CONFIG["api_timeout"])
-                if response.status_code == 200:
-                    data = response.json()
-                    quote_text = data.get("quote", "")
-                    author = data.get("author", "Unknown")
-
-                    # SECURITY: Validate API response data types and lengths
-                    if not isinstance(quote_text, str) or not isinstance(author, str):
-                        continue  # Skip invalid data types
-
-                    if len(quote_text) > 1000 or len(author) > 100:
-                        continue  # Skip overly long quotes to prevent UI overflow
-
-                    # Check if quote matches selected category
-                    if self.matches_category(quote_text, selected_category):
-                        # Normalize the text to fix capitalization issues
-                        normalized_text = self.normalize_text(quote_text)
-                        return {
-                            "text": normalized_text,
-                            "author": author
-                        }
-                    # If not matching category, try again
-                    continue
+        worker = threading.Thread(
+            target=lambda: self.quote_queue.put(self.fetch_api_quote(category, self.fetch_deadline)),
+            name='quote-fetch',
+            daemon=True
+        )
+        worker.start()
+        self.root.after(QUOTE_POLL_MS, self.poll_quote_queue)
+        return worker
 
-            except Exception as e:
-                if DEBUG_MODE:
-                    print(f"API fetch attempt {attempt + 1} failed: {e}")
-                break
+    def poll_quote_queue(self):
+        """Swap in the fetched quote once the worker delivers it"""
+        if self.closed:
+            return
+
+        try:
+            quote_data = self.quote_queue.get_nowait()
+        except queue.Empty:
+            if time.monotonic() < self.fetch_deadline:
+                self.root.after(QUOTE_POLL_MS, self.poll_quote_queue)
+            elif DEBUG_MODE:
+                print("Quote fetch deadline passed. Keeping fallback quote.")
+            return
 
-        # Fallback to curated quotes filtered by category
-        return self.get_fallback_quote(selected_category)
+        if quote_data:
+            self.display_quote(quote_data)
+        elif DEBUG_MODE:
+            print("No API quote available. Keeping fallback quote.")
 
-    def get_fallback_quote(self, category='all'):
-        """Get a random fallback quote filtered by category"""
-        if category == 'all':
-            return random.choice(FALLBACK_QUOTES)
+    def display_quote(self, quote_data):
+        """Replace the displayed quote and resize the window to fit it"""
+        self.quote_data = quote_data
+        self.update_layout()
 
-        # Filter fallback quotes by category
-        filtered = [q for q in FALLBACK_QUOTES if self.matches_category(q["text"], category)]
+        # Give the reader the full timer for the new quote
+        self.countdown.restart()
 
-        if filtered:
-            return random.choice(filtered)
+    def get_fallback_quote(self, category='all'):
+        """Get a quote from the ingested store, else the next in the built-in rotation"""
+        store = open_quote_store()
+        quote_data = None
+        if store:
+            quote_data = store.choose(category)
+            store.close()  # Don't keep the file mapped between quotes
+        # If no quotes match the category, return any quote
+        return quote_data or QUOTE_INDEX.choose(category) or QUOTE_INDEX.choose('all')
+
+    def gradient_photo(self, theme):
+        """PhotoImage of the theme's gradient at the laid-out size (rendered once)
+
+        Returns None without gradients, including when Pillow is installed
+        without its Tk bindings (e.g. Debian's separate python3-pil.imagetk);
+        gradients are then turned off for the rest of the session.
+        """
+        global PIL_AVAILABLE
+        key = (theme, self.layout.width, self.layout.height)
+        photo = self.gradient_photos.get(key)
+        if photo is None:
+            try:
+                ImageTk = lazy_import('PIL.ImageTk')
+            except ImportError as e:
+                PIL_AVAILABLE = False
+                print(f"Warning: Pillow ImageTk unavailable ({e}). Gradient backgrounds disabled.")
+                return None
+            colors = THEMES.get(theme, THEMES['light'])
+            gradient_img = self.gradient_cache.get(
+                self.layout.width, self.layout.height,
+                colors['bg'], colors['bg_gradient']
+            )
+            if not gradient_img:
+                return None
+            photo = ImageTk.PhotoImage(gradient_img)
+            # Keep reference to prevent garbage collection
+            self.gradient_photos[key] = photo
+        return photo
+
+    def prerender_gradients(self):
+        """Render every theme's gradient at the current size, so toggling is an image swap"""
+        if self.closed or not PIL_AVAILABLE:
+            return
+        with TRACER.span('prerender gradients', category='idle'):
+            for theme in THEMES:
+                self.gradient_photo(theme)
+
+    @traced('gradient')
+    def update_gradient(self):
+        """Show the gradient background for the current theme at the laid-out size"""
+        if not PIL_AVAILABLE:
+            return
 
-        # If no matches, return any quote
-        return random.choice(FALLBACK_QUOTES)
+        # Drop images rendered for a previous size
+        size = (self.layout.width, self.layout.height)
+        self.gradient_photos = {key: photo for key, photo in self.gradient_photos.items() if key[1:] == size}
+
+        photo = self.gradient_photo(self.settings.get('theme', 'light'))
+        if photo:
+            self.show_gradient(photo)
+        if self.painted:
+            self.root.after_idle(self.prerender_gradients)
+
+    def show_gradient(self, photo):
+        """Put the gradient image behind the widgets, sized to the window"""
+        gradient_label = self.widgets.get('gradient_bg')
+        if gradient_label is None:
+            # Create a label to hold the gradient background (fullscreen)
+            gradient_label = tk.Label(self.root, image=photo, bd=0, highlightthickness=0)
+            self.widgets['gradient_bg'] = gradient_label
+        else:
+            gradient_label.configure(image=photo)
+        gradient_label.place(x=0, y=0, width=self.layout.width, height=self.layout.height)
 
     def create_widgets(self, quote_data):
         """Create the UI widgets"""
         # Get current theme colors
         colors = THEMES.get(self.settings.get('theme', 'light'), THEMES['light'])
 
+        self.quote_data = quote_data
+
         # Create gradient background if PIL is available
         gradient_bg_color = colors['window_bg']
-        if PIL_AVAILABLE:
-            window_width = CONFIG.get("window_width", 340)
-            window_height = 200
-
-            gradient_img = create_diagonal_gradient(
-                window_width, window_height,
-                colors['bg'], colors['bg_gradient']
-            )
-
-            if gradient_img:
-                self.gradient_photo = ImageTk.PhotoImage(gradient_img)
-                # Create a label to hold the gradient background (fullscreen)
-                gradient_label = tk.Label(self.root, image=self.gradient_photo, bd=0, highlightthickness=0)
-                gradient_label.place(x=0, y=0, width=window_width, height=window_height)
-                # Keep reference to prevent garbage collection
-                self.widgets['gradient_bg'] = gradient_label
-                # Use empty string for bg to make frames semi-transparent visually
-                # (They'll still have the gradient showing through)
+        self.update_gradient()
 
         # Main frame - no background if gradient exists (shows gradient through)
         main_frame = tk.Frame(
@@ -844,27 +3523,28 @@ class QuoteOverlay:
         self.widgets['content_frame'] = content_frame
 
         # Quote text - NORMAL CASE, elegant typography
-        quote_font = font.Font(family='Segoe UI', size=13, weight='normal')
+        quote_font = self.fonts.get(size=self.layout.font_size)
         self.quote_label = tk.Label(
             content_frame,
-            text=f'"{quote_data["text"]}"',
+            text=f'"{quote_data.text}"',
             font=quote_font,
             fg=colors['text'],
             bg=colors['window_bg'],
-            wraplength=CONFIG["window_width"] - CONFIG["window_padding"] * 2 - 30,
+            wraplength=self.layout.wraplength,
             justify=tk.LEFT,
             cursor='hand2'
         )
         self.quote_label.pack(pady=(0, 10), anchor='w')
+        self.widgets['quote_label'] = self.quote_label
 
         # Bind click to search
-        self.quote_label.bind('<Button-1>', lambda e: self.search_quote(quote_data["text"]))
+        self.quote_label.bind('<Button-1>', lambda e: self.search_quote(self.quote_data.text))
 
         # Author text - darker and more prominent
-        author_font = font.Font(family='Segoe UI', size=12, slant='italic', weight='normal')
+        author_font = self.fonts.get(size=12, slant='italic')
         author_label = tk.Label(
             content_frame,
-            text=f'— {quote_data["author"]}',
+            text=f'— {quote_data.author}',
             font=author_font,
             fg=colors['author'],
             bg=colors['window_bg'],
@@ -874,7 +3554,7 @@ class QuoteOverlay:
         self.widgets['author_label'] = author_label
 
         # Learn more hint
-        hint_font = font.Font(family='Segoe UI', size=9, slant='italic')
+        hint_font = self.fonts.get(size=9, slant='italic')
         hint_label = tk.Label(
             content_frame,
             text='Click quote to learn more',
@@ -894,6 +3574,7 @@ class QuoteOverlay:
         self.progress_bar = tk.Frame(self.progress_frame, bg=colors['accent'], height=2)
         self.progress_bar.place(relwidth=1.0, relheight=1.0)
         self.widgets['progress_bar'] = self.progress_bar
+        self.progress_frame.bind('<Configure>', lambda e: self.countdown.set_track_width(e.width))
 
         # Hover events for pause/resume
         main_frame.bind('<Enter>', lambda e: self.pause_timer())
@@ -904,240 +3585,173 @@ class QuoteOverlay:
 
     def start_timer(self):
         """Start the countdown timer"""
-        self.start_time = time.time()
-        self.is_paused = False
-        self.update_progress()
-
-    def update_progress(self):
-        """Update progress bar and check if time is up"""
-        if self.is_paused:
-            return
+        # Track width from the layout until the progress frame reports its real size
+        self.countdown.set_track_width(self.layout.width - CONFIG["window_padding"] * 2 - 2)
+        self.countdown.start()
 
-        elapsed = (time.time() - self.start_time) * 1000  # Convert to milliseconds
-        progress = min(elapsed / CONFIG["timer_duration"], 1.0)
-
-        # Update progress bar width (shrinking from right)
-        self.progress_bar.place(relwidth=1.0 - progress, relheight=1.0)
-
-        if progress >= 1.0:
-            self.close_quote()
-        else:
-            self.timer_id = self.root.after(100, self.update_progress)
+    def draw_progress(self, width):
+        """Resize the progress bar (shrinking from right) to width pixels"""
+        self.progress_bar.place(relwidth=0, width=width, relheight=1.0)
 
     def pause_timer(self):
         """Pause the timer on hover"""
-        if not self.is_paused and self.timer_id:
-            self.root.after_cancel(self.timer_id)
-            self.is_paused = True
-            elapsed = (time.time() - self.start_time) * 1000
-            self.remaining_time = CONFIG["timer_duration"] - elapsed
+        self.countdown.pause()
 
     def resume_timer(self):
         """Resume the timer when mouse leaves"""
-        if self.is_paused:
-            self.start_time = time.time() - ((CONFIG["timer_duration"] - self.remaining_time) / 1000)
-            self.is_paused = False
-            self.update_progress()
+        self.countdown.resume()
 
     def close_quote(self):
         """Close the window with fade out animation"""
-        if self.timer_id:
-            self.root.after_cancel(self.timer_id)
+        self.countdown.cancel()
         self.fade_out()
 
     def search_quote(self, text):
         """Open Google search for the quote"""
+        url_quote = lazy_import('urllib.parse').quote
+        webbrowser = lazy_import('webbrowser')
         search_query = url_quote(f'"{text}"')
         webbrowser.open(f'https://www.google.com/search?q={search_query}')
 
     def show_settings(self):
-        """Open settings window"""
+        """Open settings window (built once, then only shown and hidden)"""
         # Pause timer while settings are open
         self.pause_timer()
 
-        # If settings window already exists, focus it
-        if self.settings_window and self.settings_window.winfo_exists():
-            self.settings_window.focus()
-            return
-
-        # Get current theme colors
-        colors = THEMES.get(self.settings.get('theme', 'light'), THEMES['light'])
-
-        # Create new settings window
-        self.settings_window = tk.Toplevel(self.root)
-        self.settings_window.title("Settings")
-        self.settings_window.geometry("400x350")
-        self.settings_window.configure(bg=colors['window_bg'])
-        self.settings_window.resizable(False, False)
-
-        # Make it stay on top
-        self.settings_window.attributes('-topmost', True)
-
-        # Handle window close
-        self.settings_window.protocol("WM_DELETE_WINDOW", self.close_settings)
-
-        # Main frame with padding
-        main_frame = tk.Frame(self.settings_window, bg=colors['window_bg'], padx=20, pady=20)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-
-        # Title
-        title_label = tk.Label(
-            main_frame,
-            text="Settings",
-            font=('Segoe UI', 16, 'bold'),
-            bg=colors['window_bg'],
-            fg=colors['text']
-        )
-        title_label.pack(pady=(0, 20))
-
-        # Timer Duration Slider
-        timer_frame = tk.Frame(main_frame, bg=colors['window_bg'])
-        timer_frame.pack(fill=tk.X, pady=10)
-
-        timer_label = tk.Label(
-            timer_frame,
-            text=f"Timer Duration: {self.settings['timerDuration']}s",
-            font=('Segoe UI', 11),
-            bg=colors['window_bg'],
-            fg=colors['text']
-        )
-        timer_label.pack(anchor='w')
-
-        timer_slider = tk.Scale(
-            timer_frame,
-            from_=5,
-            to=60,
-            orient=tk.HORIZONTAL,
-            resolution=5,
-            bg=colors['window_bg'],
-            fg=colors['accent'],
-            highlightthickness=0,
-            troughcolor=colors['progress_bg'],
-            command=lambda v: self.on_timer_change(int(v), timer_label)
-        )
-        timer_slider.set(self.settings['timerDuration'])
-        timer_slider.pack(fill=tk.X, pady=5)
-
-        # Position Selector
-        position_frame = tk.Frame(main_frame, bg=colors['window_bg'])
-        position_frame.pack(fill=tk.X, pady=10)
-
-        position_label = tk.Label(
-            position_frame,
-            text="Position:",
-            font=('Segoe UI', 11),
-            bg=colors['window_bg'],
-            fg=colors['text']
-        )
-        position_label.pack(anchor='w')
-
-        position_var = tk.StringVar(value=self.settings['position'])
-        position_options = [
-            ("Bottom Right", "bottomRight"),
-            ("Bottom Left", "bottomLeft"),
-            ("Top Right", "topRight"),
-            ("Top Left", "topLeft")
-        ]
-
-        position_dropdown = ttk.Combobox(
-            position_frame,
-            textvariable=position_var,
-            values=[opt[0] for opt in position_options],
-            state='readonly',
-            font=('Segoe UI', 10)
-        )
-        # Set current value
-        for opt_label, opt_value in position_options:
-            if opt_value == self.settings['position']:
-                position_dropdown.set(opt_label)
-                break
-        position_dropdown.pack(fill=tk.X, pady=5)
-        position_dropdown.bind('<<ComboboxSelected>>', lambda e: self.on_position_change(position_var, position_options))
+        if not (self.settings_window and self.settings_window.winfo_exists()):
+            self.build_settings_window()
+        self.sync_settings_window()
 
-        # Font Size Selector
-        font_size_frame = tk.Frame(main_frame, bg=colors['window_bg'])
-        font_size_frame.pack(fill=tk.X, pady=10)
+        self.settings_window.deiconify()
+        self.settings_window.lift()
+        self.settings_window.focus()
 
-        font_size_label = tk.Label(
-            font_size_frame,
-            text="Font Size:",
-            font=('Segoe UI', 11),
-            bg=colors['window_bg'],
-            fg=colors['text']
-        )
-        font_size_label.pack(anchor='w')
-
-        font_size_var = tk.StringVar(value=self.settings['fontSize'].capitalize())
-        font_size_dropdown = ttk.Combobox(
-            font_size_frame,
-            textvariable=font_size_var,
-            values=['Small', 'Medium', 'Large'],
-            state='readonly',
-            font=('Segoe UI', 10)
-        )
-        font_size_dropdown.set(self.settings['fontSize'].capitalize())
-        font_size_dropdown.pack(fill=tk.X, pady=5)
-        font_size_dropdown.bind('<<ComboboxSelected>>', lambda e: self.on_font_size_change(font_size_var))
-
-        # Category Selector
-        category_frame = tk.Frame(main_frame, bg=colors['window_bg'])
-        category_frame.pack(fill=tk.X, pady=10)
-
-        category_label = tk.Label(
-            category_frame,
-            text="Quote Category:",
-            font=('Segoe UI', 11),
-            bg=colors['window_bg'],
-            fg=colors['text']
-        )
-        category_label.pack(anchor='w')
-
-        category_var = tk.StringVar(value=self.settings['category'])
-        category_options = [
-            ("Motivation & Inspiration", "motivation"),
-            ("Learning & Growth", "learning"),
-            ("Creativity & Innovation", "creativity"),
-            ("Productivity & Focus", "productivity"),
-            ("All Categories", "all")
-        ]
-
-        category_dropdown = ttk.Combobox(
-            category_frame,
-            textvariable=category_var,
-            values=[opt[0] for opt in category_options],
-            state='readonly',
-            font=('Segoe UI', 10)
-        )
-        # Set current value
-        for opt_label, opt_value in category_options:
-            if opt_value == self.settings['category']:
-                category_dropdown.set(opt_label)
-                break
-        category_dropdown.pack(fill=tk.X, pady=5)
-        category_dropdown.bind('<<ComboboxSelected>>', lambda e: self.on_category_change(category_var, category_options))
-
-        # Close button
-        close_button = tk.Button(
-            main_frame,
-            text="Close",
-            font=('Segoe UI', 11, 'bold'),
-            bg=colors['accent'],
-            fg='white',
-            activebackground=colors['accent_hover'],
-            activeforeground='white',
-            bd=0,
-            cursor='hand2',
-            command=self.close_settings,
-            padx=20,
-            pady=8
-        )
-        close_button.pack(pady=(20, 0))
+    def build_settings_window(self):
+        """Create the (hidden) settings window and its controls"""
+        if self.closed or (self.settings_window and self.settings_window.winfo_exists()):
+            return
+        ttk = lazy_import('tkinter.ttk')
+
+        with TRACER.span('build settings window', category='idle'):
+            # Widgets by style role, for recoloring when the theme changes
+            self.settings_themed = {role: [] for role in SETTINGS_WINDOW_STYLES}
+            self.settings_controls = {}
+
+            def themed(role, widget):
+                self.settings_themed[role].append(widget)
+                return widget
+
+            # Create the settings window, hidden until show_settings()
+            self.settings_window = themed('window', tk.Toplevel(self.root))
+            self.settings_window.withdraw()
+            self.settings_window.title("Settings")
+            self.settings_window.geometry("400x350")
+            self.settings_window.resizable(False, False)
+
+            # Make it stay on top
+            self.settings_window.attributes('-topmost', True)
+
+            # Handle window close
+            self.settings_window.protocol("WM_DELETE_WINDOW", self.close_settings)
+
+            # Main frame with padding
+            main_frame = themed('frame', tk.Frame(self.settings_window, padx=20, pady=20))
+            main_frame.pack(fill=tk.BOTH, expand=True)
+
+            # Title
+            title_label = themed('label', tk.Label(main_frame, text="Settings", font=('Segoe UI', 16, 'bold')))
+            title_label.pack(pady=(0, 20))
+
+            # Timer Duration Slider
+            timer_frame = themed('frame', tk.Frame(main_frame))
+            timer_frame.pack(fill=tk.X, pady=10)
+
+            timer_label = themed('label', tk.Label(timer_frame, font=('Segoe UI', 11)))
+            timer_label.pack(anchor='w')
+            self.settings_controls['timer_label'] = timer_label
+
+            timer_slider = themed('scale', tk.Scale(
+                timer_frame,
+                from_=5,
+                to=60,
+                orient=tk.HORIZONTAL,
+                resolution=5,
+                highlightthickness=0,
+                command=lambda v: self.on_timer_change(int(float(v)), timer_label)
+            ))
+            timer_slider.pack(fill=tk.X, pady=5)
+            self.settings_controls['timer_slider'] = timer_slider
+
+            # Position, font size and category selectors
+            selectors = (
+                ('position', "Position:", POSITION_OPTIONS,
+                 lambda var: self.on_position_change(var, POSITION_OPTIONS)),
+                ('fontSize', "Font Size:", [(size.capitalize(), size) for size in FONT_SIZES],
+                 self.on_font_size_change),
+                ('category', "Quote Category:", CATEGORY_OPTIONS,
+                 lambda var: self.on_category_change(var, CATEGORY_OPTIONS)),
+            )
+            for key, text, options, handler in selectors:
+                frame = themed('frame', tk.Frame(main_frame))
+                frame.pack(fill=tk.X, pady=10)
+                themed('label', tk.Label(frame, text=text, font=('Segoe UI', 11))).pack(anchor='w')
+
+                var = tk.StringVar(master=self.settings_window)
+                dropdown = ttk.Combobox(
+                    frame,
+                    textvariable=var,
+                    values=[opt[0] for opt in options],
+                    state='readonly',
+                    font=('Segoe UI', 10)
+                )
+                dropdown.pack(fill=tk.X, pady=5)
+                dropdown.bind('<<ComboboxSelected>>', lambda e, handler=handler, var=var: handler(var))
+                self.settings_controls[key] = (dropdown, options)
+
+            # Close button
+            close_button = themed('button', tk.Button(
+                main_frame,
+                text="Close",
+                font=('Segoe UI', 11, 'bold'),
+                bd=0,
+                cursor='hand2',
+                command=self.close_settings,
+                padx=20,
+                pady=8
+            ))
+            close_button.pack(pady=(20, 0))
+
+            self.settings_window_theme = None
+            self.sync_settings_window()
+
+    def sync_settings_window(self):
+        """Bring the controls and colors of the settings window up to date"""
+        theme = self.settings.get('theme', 'light')
+        if theme != self.settings_window_theme:
+            styles = SETTINGS_WINDOW_THEME_STYLES.get(theme, SETTINGS_WINDOW_THEME_STYLES['light'])
+            for role, widgets in self.settings_themed.items():
+                for widget in widgets:
+                    widget.configure(**styles[role])
+            self.settings_window_theme = theme
+
+        controls = self.settings_controls
+        controls['timer_label'].configure(text=f"Timer Duration: {self.settings['timerDuration']}s")
+        controls['timer_slider'].set(self.settings['timerDuration'])
+        for key in ('position', 'fontSize', 'category'):
+            dropdown, options = controls[key]
+            for opt_label, opt_value in options:
+                if opt_value == self.settings[key]:
+                    dropdown.set(opt_label)
+                    break
 
     def on_timer_change(self, value, label):
         """Handle timer duration change"""
+        if value == self.settings['timerDuration']:
+            return  # Slider moved back to the saved value (or synced to it)
         self.settings['timerDuration'] = value
         label.config(text=f"Timer Duration: {value}s")
         CONFIG["timer_duration"] = value * 1000
+        self.countdown.duration_ms = CONFIG["timer_duration"]
         self.save_settings()
 
     def on_position_change(self, var, options):
@@ -1167,22 +3781,398 @@ class QuoteOverlay:
                 break
 
     def close_settings(self):
-        """Close settings window and resume timer"""
-        if self.settings_window:
-            self.settings_window.destroy()
-            self.settings_window = None
+        """Hide settings window (kept for next time) and resume timer"""
+        self.settings_store.flush()
+        if self.settings_window and self.settings_window.winfo_exists():
+            self.settings_window.withdraw()
         # Resume timer
         self.resume_timer()
 
     def run(self):
         """Start the application"""
         self.root.mainloop()
+        # Write any change still inside the debounce window
+        self.settings_store.flush()
+        # Include spans recorded by worker threads after the first paint
+        TRACER.write()
+
+
+class CanvasQuoteOverlay(QuoteOverlay):
+    """Overlay drawn as items on a single tk.Canvas (renderer setting "canvas")
+
+    The gradient, text, buttons and progress bar are canvas items instead of
+    a tree of Frames and Labels, so a progress tick is one coords() call and
+    a theme switch is one itemconfigure() per tag, with no geometry managers
+    involved. Hover colors use the items' activefill; button labels are
+    disabled items so the pointer picks the button shape beneath them.
+    """
+
+    BUTTON_COMMANDS = {'theme_btn': 'toggle_theme', 'settings_btn': 'show_settings'}
+
+    def create_widgets(self, quote_data):
+        """Create the canvas and its items"""
+        self.quote_data = quote_data
+        theme = self.settings.get('theme', 'light')
+        styles = CANVAS_THEME_STYLES.get(theme, CANVAS_THEME_STYLES['light'])
+
+        # The 1 px highlight ring is the window border, as on the widget tree's main frame
+        canvas = tk.Canvas(self.root, bd=0, highlightthickness=1, **styles['canvas'])
+        canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas = canvas
+        self.widgets['canvas'] = canvas
+
+        canvas.create_image(0, 0, anchor='nw', tags=('gradient',))
+        canvas.create_rectangle(0, 0, 0, 0, width=0, tags=('top_bar',))
+
+        canvas.create_text(0, 0, text='×', anchor='e', font=self.fonts.get(size=18, weight='bold'),
+                           tags=('close_btn',))
+        button_font = self.fonts.get(size=8, weight='bold')
+        for tag, _ in CARD_BUTTONS:
+            canvas.create_rectangle(0, 0, 0, 0, width=0, tags=(tag, f'{tag}_bg'))
+            canvas.create_text(0, 0, font=button_font, state='disabled', fill='white', disabledfill='white',
+                               tags=(tag, f'{tag}_text'))
+        canvas.itemconfigure('settings_btn_text', text='Settings')
+
+        canvas.create_text(0, 0, anchor='nw', justify=tk.LEFT, tags=('quote',))
+        canvas.create_text(0, 0, anchor='ne', justify=tk.RIGHT, font=self.fonts.get(size=12, slant='italic'),
+                           tags=('author',))
+        canvas.create_text(0, 0, anchor='n', text='Click quote to learn more',
+                           font=self.fonts.get(size=9, slant='italic'), tags=('hint',))
+        canvas.create_rectangle(0, 0, 0, 0, width=0, tags=('progress_track',))
+        canvas.create_rectangle(0, 0, 0, 0, width=0, tags=('progress_bar',))
+
+        for tag, options in styles.items():
+            if tag != 'canvas':
+                canvas.itemconfigure(tag, **options)
+        self.render_quote()
+        self.update_gradient()
+
+        # Clickable items
+        canvas.tag_bind('quote', '<Button-1>', lambda e: self.search_quote(self.quote_data.text))
+        canvas.tag_bind('close_btn', '<Button-1>', lambda e: self.close_quote())
+        for tag, command in self.BUTTON_COMMANDS.items():
+            canvas.tag_bind(tag, '<Button-1>', lambda e, command=command: getattr(self, command)())
+        for tag in ('quote', 'close_btn', 'theme_btn', 'settings_btn'):
+            canvas.tag_bind(tag, '<Enter>', lambda e: canvas.configure(cursor='hand2'))
+            canvas.tag_bind(tag, '<Leave>', lambda e: canvas.configure(cursor=''))
+
+        # Hover events for pause/resume (one widget, so no child Enter/Leave noise)
+        canvas.bind('<Enter>', lambda e: self.pause_timer())
+        canvas.bind('<Leave>', lambda e: self.resume_timer())
+
+        # Keyboard shortcuts
+        self.root.bind('<Escape>', lambda e: self.close_quote())
+
+    def render_quote(self):
+        """Position every item for the current layout (see card_geometry())"""
+        canvas = self.canvas
+        geometry = card_geometry(self.layout, self.fonts)
+
+        # Requested size excludes the 1 px highlight ring on each side
+        canvas.configure(width=self.layout.width - 2, height=self.layout.height - 2)
+        for tag in ('top_bar', 'close_btn', 'author', 'hint'):
+            canvas.coords(tag, *geometry[tag])
+        for tag, _ in CARD_BUTTONS:
+            canvas.coords(f'{tag}_bg', *geometry[tag])
+            canvas.coords(f'{tag}_text', *geometry[f'{tag}_text'])
+
+        canvas.itemconfigure('quote', text=f'"{self.quote_data.text}"', width=self.layout.wraplength,
+                             font=self.fonts.get(size=self.layout.font_size))
+        canvas.coords('quote', *geometry['quote'])
+        canvas.itemconfigure('author', text=f'— {self.quote_data.author}')
+
+        x0, y0, x1, y1 = geometry['progress']
+        self.progress_origin = (x0, y0)
+        canvas.coords('progress_track', x0, y0, x1, y1)
+        # The canvas has no <Configure> on the track, so a re-layout resizes the countdown here
+        self.countdown.set_track_width(x1 - x0)
+        bar_width = self.countdown.drawn_width if self.countdown.drawn_width is not None else x1 - x0
+        self.draw_progress(bar_width)
+
+    def show_gradient(self, photo):
+        self.canvas.itemconfigure('gradient', image=photo)
+
+    def apply_theme(self, theme='light'):
+        """Apply theme colors as one itemconfigure per tag"""
+        styles = CANVAS_THEME_STYLES.get(theme, CANVAS_THEME_STYLES['light'])
+        self.root.configure(bg=styles['canvas']['bg'])
+        for tag, options in styles.items():
+            if tag == 'canvas':
+                self.canvas.configure(**options)
+            else:
+                self.canvas.itemconfigure(tag, **options)
+
+        photo = self.gradient_photo(theme) if PIL_AVAILABLE else None
+        if photo:
+            self.show_gradient(photo)
+
+    def draw_progress(self, width):
+        """Resize the progress bar (shrinking from right) to width pixels"""
+        x0, y0 = self.progress_origin
+        self.canvas.coords('progress_bar', x0, y0, x0 + width, y0 + 2)
+
+
+def overlay_class():
+    """Overlay class for the renderer setting (settings come from the parse cache)"""
+    if SETTINGS_LOADER.load().get('renderer') == 'canvas':
+        return CanvasQuoteOverlay
+    return QuoteOverlay
+
+
+def benchmark_renderers(count=10, frames=300):
+    """Compare time-to-first-paint and per-frame cost of the widget tree and canvas renderers"""
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"The renderer benchmark needs a display: {e}")
+        return False
+    root.withdraw()
+
+    tempfile = lazy_import('tempfile')
+    directory = tempfile.mkdtemp()
+    pool = QuotePool(path=os.path.join(directory, 'quote_pool.jsonl'))
+    pool.add([Quote(f'{quote.text} ({i})', quote.author, quote.mask)
+              for i in range(count * 4) for quote in QUOTE_INDEX.quotes[:len(FALLBACK_QUOTES)]])
+    shared = dict(
+        quote_pool=pool,
+        quote_client=QuoteClient(),
+        gradient_cache=GradientCache(directory=os.path.join(directory, 'gradient_cache')),
+        fonts=FontRegistry(root),
+    )
+
+    print(f"{'renderer':<9} {'first paint ms':>15} {'progress frame ms':>18} {'theme switch ms':>16}")
+    for name, cls in (('widgets', QuoteOverlay), ('canvas', CanvasQuoteOverlay)):
+        paint = progress = theme = 0.0
+        for _ in range(count):
+            start = time.perf_counter()
+            overlay = cls(root, **shared)
+            overlay.root.update_idletasks()
+            paint += time.perf_counter() - start
+
+            overlay.countdown.cancel()
+            track = overlay.countdown.track_width
+            start = time.perf_counter()
+            for frame in range(frames):
+                overlay.draw_progress(track - frame % max(track, 1))
+                overlay.root.update_idletasks()
+            progress += (time.perf_counter() - start) / frames
+
+            start = time.perf_counter()
+            for frame in range(10):
+                overlay.apply_theme('dark' if frame % 2 == 0 else 'light')
+                overlay.root.update_idletasks()
+            theme += (time.perf_counter() - start) / 10
+
+            overlay.on_close = None
+            overlay.close_window()
+
+        print(f"{name:<9} {paint / count * 1000:>15.2f} {progress / count * 1000:>18.3f} "
+              f"{theme / count * 1000:>16.2f}")
+
+    root.destroy()
+    lazy_import('shutil').rmtree(directory, ignore_errors=True)
+    return True
+
+
+class QuoteHost:
+    """Resident single-instance host for --daemon mode
+
+    Keeps one hidden Tk root, the quote pool, API client and gradient cache
+    warm, and shows a new overlay (a Toplevel) whenever a launcher asks. The
+    launcher connects to a localhost socket whose port and random token are
+    published in DAEMON_FILE. Requests are handed to the Tk thread through a
+    queue: with threaded Tcl the accept thread wakes the main loop with a
+    virtual event, otherwise the queue is polled.
+    """
+
+    POLL_MS = 50
+
+    def __init__(self):
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.quote_pool = QuotePool(index=QUOTE_INDEX)
+        self.quote_client = QuoteClient()
+        self.gradient_cache = GradientCache()
+        self.fonts = FontRegistry(self.root)
+        self.overlay = None
+        self.requests = queue.Queue()
+        self.threaded = bool(self.root.tk.call('info', 'exists', 'tcl_platform(threaded)'))
+        self.root.bind('<<QuoteRequest>>', lambda e: self.process_requests())
+
+        socket = lazy_import('socket')
+        self.token = lazy_import('secrets').token_hex(16)
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(4)
+        self.write_daemon_file(self.server.getsockname()[1])
+
+    def write_daemon_file(self, port):
+        """Publish the port and token for launchers (readable by this user only)"""
+        fd = os.open(DAEMON_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"port": port, "token": self.token, "pid": os.getpid()}, f)
+
+    def serve(self):
+        """Accept launcher connections (background thread)"""
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return  # Server socket closed on shutdown
+            with conn:
+                try:
+                    self.handle(conn)
+                except (OSError, ValueError) as e:
+                    if DEBUG_MODE:
+                        print(f"Daemon request failed: {e}")
+
+    def handle(self, conn):
+        """Validate one request line and queue it for the Tk thread"""
+        received = time.perf_counter()
+        conn.settimeout(1.0)
+        request = json.loads(conn.makefile('rb').readline(1024))
+
+        hmac = lazy_import('hmac')
+        if (not isinstance(request, dict) or not isinstance(request.get("token"), str)
+                or not hmac.compare_digest(request["token"], self.token)
+                or request.get("command") not in ('show', 'stop')):
+            conn.sendall(b'error\n')
+            return
+
+        self.requests.put((request["command"], received))
+        conn.sendall(b'ok\n')
+        if self.threaded:
+            try:
+                # Marshalled to the Tk thread by threaded Tcl
+                self.root.event_generate('<<QuoteRequest>>', when='tail')
+            except (RuntimeError, tk.TclError):
+                pass  # Main loop not running yet; run() drains the queue on start
+
+    def process_requests(self):
+        """Run queued launcher requests on the Tk thread"""
+        while True:
+            try:
+                command, received = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if command == 'show':
+                self.show_quote(received)
+            elif command == 'stop':
+                self.root.quit()
+
+        if not self.threaded:
+            self.root.after(self.POLL_MS, self.process_requests)
+
+    def show_quote(self, received=None):
+        """Show a new overlay, replacing one that is still visible"""
+        if self.overlay is not None:
+            self.overlay.on_close = None
+            self.overlay.close_window()
+
+        received = received or time.perf_counter()
+        self.overlay = overlay_class()(
+            self.root,
+            quote_pool=self.quote_pool,
+            quote_client=self.quote_client,
+            gradient_cache=self.gradient_cache,
+            fonts=self.fonts,
+            on_close=self.overlay_closed
+        )
+        if DEBUG_MODE:
+            self.root.after_idle(lambda: print(
+                f"Time to visible: {(time.perf_counter() - received) * 1000:.1f} ms"
+            ))
+
+    def overlay_closed(self, overlay):
+        if self.overlay is overlay:
+            self.overlay = None
+
+    def run(self):
+        """Show the first quote, then serve launcher requests until stopped"""
+        threading.Thread(target=self.serve, name='quote-daemon', daemon=True).start()
+        self.show_quote()
+        self.root.after(0, self.process_requests)
+        try:
+            self.root.mainloop()
+        finally:
+            self.server.close()
+            try:
+                os.remove(DAEMON_FILE)
+            except OSError:
+                pass
+
+
+def trigger_daemon(command='show'):
+    """Ask a running resident host to act; returns False if none answered"""
+    try:
+        with open(DAEMON_FILE, 'r') as f:
+            info = json.load(f)
+        address = ('127.0.0.1', int(info["port"]))
+        request = json.dumps({"token": info["token"], "command": command}) + '\n'
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+    socket = lazy_import('socket')
+    try:
+        with socket.create_connection(address, timeout=CONFIG["daemon_connect_timeout"]) as conn:
+            conn.sendall(request.encode())
+            return conn.makefile('rb').readline().strip() == b'ok'
+    except OSError:
+        return False  # Stale daemon file or host not responding
+
+
+# Everything between STARTUP_BEGIN and here is module load time
+TRACER.add('module load', STARTUP_BEGIN, time.perf_counter())
 
 
 if __name__ == "__main__":
+    if '--benchmark-gradient' in sys.argv:
+        sys.exit(0 if benchmark_gradient() else 1)
+    if '--benchmark-categories' in sys.argv:
+        sys.exit(0 if benchmark_categories() else 1)
+    if '--benchmark-normalize' in sys.argv:
+        sys.exit(0 if benchmark_normalize() else 1)
+    if '--benchmark-quote-memory' in sys.argv:
+        sys.exit(0 if benchmark_quote_memory() else 1)
+    if '--benchmark-store' in sys.argv:
+        sys.exit(0 if benchmark_store() else 1)
+    if '--benchmark-renderers' in sys.argv:
+        sys.exit(0 if benchmark_renderers() else 1)
+    if '--ingest' in sys.argv:
+        position = sys.argv.index('--ingest') + 1
+        if len(sys.argv) <= position:
+            print("Usage: python quote_overlay.py --ingest FILE")
+            sys.exit(2)
+        try:
+            accepted = ingest_quotes(sys.argv[position])
+        except (OSError, ValueError) as e:
+            print(f"Ingest failed: {e}")
+            sys.exit(1)
+        sys.exit(0 if accepted else 1)
+    if '--render-cards' in sys.argv:
+        position = sys.argv.index('--render-cards') + 1
+        has_dir = len(sys.argv) > position and not sys.argv[position].startswith('--')
+        output_dir = sys.argv[position] if has_dir else CARD_OUTPUT_DIR
+        sys.exit(0 if render_cards(output_dir) else 1)
+    if '--check-startup' in sys.argv:
+        sys.exit(0 if check_startup() else 1)
+    if '--check-countdown' in sys.argv:
+        sys.exit(0 if check_countdown() else 1)
+    if '--check-quote-client' in sys.argv:
+        sys.exit(0 if check_quote_client() else 1)
+
+    if '--stop-daemon' in sys.argv:
+        sys.exit(0 if trigger_daemon('stop') else 1)
+
     try:
-        app = QuoteOverlay()
-        app.run()
+        if '--daemon' in sys.argv:
+            # Single instance: if a host is already running, just ask it for a quote
+            if not trigger_daemon():
+                QuoteHost().run()
+        elif not trigger_daemon():
+            # No resident host - show the overlay in this process
+            app = overlay_class()()
+            app.run()
     except KeyboardInterrupt:
         sys.exit(0)
     except Exception as e: